@@ -0,0 +1,66 @@
+"""
+Gunicorn 설정 (운영 서빙)
+systemd 소켓(saju.socket)이 포트를 열고 있으므로, 재시작 중에 들어온 연결은 거절되지 않고 커널 backlog에서
+새 워커를 기다립니다. 종료(TERM) 시 워커는 graceful_timeout 동안 처리 중인 요청을 마친 뒤 종료됩니다.
+
+    systemctl reload saju    # HUP: 설정을 다시 읽고 워커를 하나씩 교체 (코드 변경은 restart 필요, preload_app)
+    systemctl restart saju   # 새 코드 배포: 처리 중인 요청을 마치고 재시작
+"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+# Prometheus 지표를 워커 간에 합산하기 위한 디렉토리 (앱 import 전에 설정되어야 함)
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "saju-prometheus"))
+os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+# systemd 소켓 활성화(LISTEN_FDS)로 실행되면 bind는 무시되고 systemd가 넘겨준 소켓을 사용
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+
+# I/O(Gemini, MySQL) 대기가 대부분이므로 프로세스마다 스레드를 여러 개 둠.
+# 비동기 작업(FORTUNE_ASYNC)의 상태는 프로세스 메모리에 있으므로 /jobs/<id> 폴링이 같은 프로세스로 가도록 워커를 1개로 둠
+_async_jobs = os.getenv("FORTUNE_ASYNC", "0") == "1"
+workers = int(os.getenv("GUNICORN_WORKERS") or os.getenv("WEB_CONCURRENCY")
+              or (1 if _async_jobs else multiprocessing.cpu_count() * 2 + 1))
+# 앱이 서버 전체 한도(GEMINI_RATE_LIMIT 등)를 워커 수로 나눌 수 있도록 알려줌 (앱 import 전에 설정되어야 함)
+os.environ["WEB_CONCURRENCY"] = str(workers)
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS") or (32 if _async_jobs else 8))
+
+# 마스터에서 앱을 한 번 import하고 워커를 fork (DB 풀, Gemini 세션, 작업 스레드는 처음 사용할 때 워커 안에서 생성)
+preload_app = True
+
+# SSE 스트리밍과 Gemini 재시도 시간(GEMINI_READ_TIMEOUT + 백오프)보다 길게
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "90"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "75"))  # ALB idle timeout(60초)보다 길게 두어 ALB 쪽에서 먼저 끊도록 함
+
+# 메모리 누수 대비로 일정 요청 수마다 워커를 교체 (jitter로 동시에 교체되지 않게 함, 비동기 작업 모드에서는 작업 상태를 잃으므로 끔)
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS") or (0 if _async_jobs else 2000))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "200"))
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+
+def on_starting(server):
+    """이전 실행에서 남은 지표 파일을 지우고 시작합니다 (HUP reload 때는 호출되지 않음)."""
+    metrics_dir = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """종료된 워커의 in-flight 게이지를 합산에서 뺍니다."""
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
+
+
+def worker_exit(server, worker):
+    """워커 종료 시 실행 중인 비동기 작업을 마치고 write-behind 큐에 남은 풀이 결과를 저장합니다."""
+    import app
+    app.fortune_jobs.close()
+    app.log_writer.close()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Schema Migrations
+migrations/ 디렉토리의 번호가 붙은 SQL 파일을 순서대로 한 번씩 적용합니다.
+
+적용한 버전은 schema_migrations 테이블에 기록되므로 배포할 때마다 실행해도 안전합니다.
+DB 접속 정보는 app.py와 같은 환경 변수(RDS_HOST, RDS_PORT, RDS_USER, RDS_PASSWORD, RDS_DATABASE)를 사용합니다.
+"""
+
+import argparse
+import glob
+import os
+import sys
+
+import pymysql
+from dotenv import load_dotenv
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
+
+def connect():
+    load_dotenv()
+    return pymysql.connect(
+        host=os.getenv("RDS_HOST"),
+        port=int(os.getenv("RDS_PORT", "3306")),
+        user=os.getenv("RDS_USER", "admin"),
+        password=os.getenv("RDS_PASSWORD", "yourstrongpassword"),
+        database=os.getenv("RDS_DATABASE", "saju"),
+        autocommit=True
+    )
+
+
+def list_migrations(directory=MIGRATIONS_DIR):
+    """(버전, 경로) 목록을 파일 이름 순서로 반환합니다. 버전은 확장자를 뺀 파일 이름입니다."""
+    paths = sorted(glob.glob(os.path.join(directory, "*.sql")))
+    return [(os.path.splitext(os.path.basename(path))[0], path) for path in paths]
+
+
+def split_statements(sql):
+    """주석 줄을 빼고 세미콜론으로 문장을 나눕니다 (마이그레이션 파일에는 프로시저를 쓰지 않습니다)."""
+    lines = [line for line in sql.splitlines() if not line.strip().startswith("--")]
+    return [statement.strip() for statement in "\n".join(lines).split(";") if statement.strip()]
+
+
+def applied_versions(cursor):
+    cursor.execute(
+        "CREATE TABLE IF NOT EXISTS schema_migrations ("
+        " version VARCHAR(255) PRIMARY KEY,"
+        " applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+    )
+    cursor.execute("SELECT version FROM schema_migrations")
+    return {row[0] for row in cursor.fetchall()}
+
+
+def migrate(conn, dry_run=False):
+    """적용되지 않은 마이그레이션을 적용하고 적용한 버전 목록을 반환합니다.
+
+    MySQL DDL은 트랜잭션으로 묶이지 않으므로 실패하면 그 자리에서 멈추고, 고친 뒤 다시 실행합니다.
+    """
+    applied = []
+    with conn.cursor() as cursor:
+        done = applied_versions(cursor)
+        for version, path in list_migrations():
+            if version in done:
+                continue
+            print(f"🔧 마이그레이션 적용: {version}" + (" (dry run)" if dry_run else ""))
+            if not dry_run:
+                with open(path, 'r', encoding='utf-8') as f:
+                    for statement in split_statements(f.read()):
+                        cursor.execute(statement)
+                cursor.execute("INSERT INTO schema_migrations (version) VALUES (%s)", (version,))
+            applied.append(version)
+    return applied
+
+
+def main(argv=None):
+    """마이그레이션 실행을 위한 메인 함수입니다."""
+    parser = argparse.ArgumentParser(description="logs 테이블 스키마 마이그레이션을 적용합니다.")
+    parser.add_argument("--dry-run", action="store_true", help="적용할 마이그레이션만 출력합니다")
+    args = parser.parse_args(argv)
+
+    try:
+        conn = connect()
+    except pymysql.err.OperationalError as e:
+        print(f"❌ DB 연결 실패: {e}")
+        sys.exit(1)
+    try:
+        applied = migrate(conn, args.dry_run)
+    finally:
+        conn.close()
+    if not applied:
+        print("✅ 적용할 마이그레이션이 없습니다")
+    else:
+        print(f"✅ 마이그레이션 {'적용 예정' if args.dry_run else '완료'}: {len(applied)}개")
+
+if __name__ == "__main__":
+    main()
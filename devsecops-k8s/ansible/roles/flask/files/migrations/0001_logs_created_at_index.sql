@@ -0,0 +1,2 @@
+-- /logs 최신순 목록과 keyset 페이지네이션 (created_at DESC, id DESC) 용 인덱스
+ALTER TABLE logs ADD INDEX idx_logs_created_at_id (created_at, id);
@@ -0,0 +1,2 @@
+-- 같은 입력(이름, 생일, 시간)의 최근 풀이 결과 조회 (결과 캐시의 DB 계층) 용 인덱스
+ALTER TABLE logs ADD INDEX idx_logs_prompt (name, birth, hour);
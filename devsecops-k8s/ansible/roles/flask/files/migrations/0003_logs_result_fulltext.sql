@@ -0,0 +1,3 @@
+-- /logs/search 풀이 본문 검색용 FULLTEXT 인덱스. 한국어는 단어에 조사가 붙으므로 공백 단위가 아닌 ngram 파서 사용 (MySQL 5.7.6+)
+-- 테이블의 첫 FULLTEXT 인덱스는 테이블을 다시 만들므로 행이 많으면 한가한 시간에 배포
+ALTER TABLE logs ADD FULLTEXT INDEX ft_logs_result (result) WITH PARSER ngram;
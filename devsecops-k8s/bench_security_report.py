@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Security Report Generator Benchmark
+합성(synthetic) SARIF 입력으로 generate_security_report.py의 단계별 성능을 측정합니다.
+
+각 단계는 별도 프로세스에서 실행되어 wall time, 최대 RSS, tracemalloc 최대 할당량을 기록하며,
+결과는 JSON으로 저장되어 커밋 간 비교(--compare)에 사용할 수 있습니다. 외부 의존성 없이 오프라인으로 동작합니다.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Dict, List, Optional
+
+DEFAULT_SIZES = "1000,100000,1000000"
+DEFAULT_STAGES = "parse,parse_stream,report,analysis"
+STAGES = ("parse", "parse_stream", "report", "analysis")
+
+# Trivy 스캔 결과와 비슷한 분포: 소수의 rule/파일에 취약점이 몰림 (Zipf), 심각도는 중간·낮음이 대부분
+SEVERITY_WEIGHTS = (("error", 15), ("warning", 45), ("note", 38), ("none", 2))
+RULE_COUNT = 5000
+PATH_COUNT = 800
+ZIPF_EXPONENT = 1.2
+PATH_TEMPLATES = (
+    "services/{svc}/requirements.txt",
+    "services/{svc}/package-lock.json",
+    "services/{svc}/go.sum",
+    "terraform/modules/{svc}/main.tf",
+    "images/{svc}/Dockerfile",
+)
+
+
+def _zipf_weights(count: int) -> List[float]:
+    return [1.0 / (rank ** ZIPF_EXPONENT) for rank in range(1, count + 1)]
+
+
+def generate_synthetic_sarif(file_path: str, result_count: int, seed: int = 42) -> None:
+    """결정적인(같은 seed면 같은 내용) 합성 SARIF 파일을 만듭니다.
+
+    결과 목록을 메모리에 만들지 않고 result 단위로 바로 파일에 씁니다.
+    """
+    rng = random.Random(seed)
+    rules = [f"CVE-{2015 + i % 10}-{10000 + i}" for i in range(RULE_COUNT)]
+    paths = [PATH_TEMPLATES[i % len(PATH_TEMPLATES)].format(svc=f"svc-{i // len(PATH_TEMPLATES):03d}")
+             for i in range(PATH_COUNT)]
+    rng.shuffle(paths)
+    rule_weights = _zipf_weights(len(rules))
+    path_weights = _zipf_weights(len(paths))
+    levels = [level for level, _ in SEVERITY_WEIGHTS]
+    level_weights = [weight for _, weight in SEVERITY_WEIGHTS]
+    batch = 10000
+
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write('{"version": "2.1.0", "$schema": "https://json.schemastore.org/sarif-2.1.0.json", "runs": [{')
+        f.write('"tool": {"driver": {"name": "Trivy", "rules": ')
+        json.dump([{"id": rule, "shortDescription": {"text": f"{rule} vulnerability"},
+                    "help": {"text": f"Vulnerability {rule}\nSee https://avd.aquasec.com/nvd/{rule.lower()}"}}
+                   for rule in rules], f)
+        f.write('}}, "results": [')
+        written = 0
+        while written < result_count:
+            n = min(batch, result_count - written)
+            chosen_rules = rng.choices(rules, rule_weights, k=n)
+            chosen_paths = rng.choices(paths, path_weights, k=n)
+            chosen_levels = rng.choices(levels, level_weights, k=n)
+            for rule, path, level in zip(chosen_rules, chosen_paths, chosen_levels):
+                package = f"pkg-{rng.randrange(2000)}"
+                result = {
+                    "ruleId": rule,
+                    "level": level,
+                    "message": {"text": f"Package: {package}\nInstalled Version: 1.{rng.randrange(20)}.{rng.randrange(10)}\n"
+                                        f"Vulnerability {rule}\nSeverity: {level.upper()}"},
+                    "locations": [{"physicalLocation": {"artifactLocation": {"uri": path, "uriBaseId": "ROOTPATH"},
+                                                        "region": {"startLine": 1 + rng.randrange(400)}}}]
+                }
+                f.write(("," if written else "") + json.dumps(result))
+                written += 1
+        f.write('], "columnKind": "utf16CodeUnits"}]}\n')
+
+
+def _run_stage(stage: str, sarif_path: str, trace: bool) -> Dict:
+    """단계 하나를 실행하고 측정값을 반환합니다 (별도 프로세스에서 호출)."""
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import generate_security_report as report
+
+    # report/analysis 단계는 파싱 결과가 필요하므로 측정 전에 미리 파싱
+    parsed = None
+    if stage in ("report", "analysis"):
+        parsed = report.parse_sarif_file(sarif_path)
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+
+    if stage == "parse":
+        result = report.parse_sarif_file(sarif_path)
+    elif stage == "parse_stream":
+        result = report.parse_sarif_file(sarif_path, streaming=True)
+    elif stage == "report":
+        result = {"report_chars": sum(len(chunk) for chunk in report.iter_ai_report(parsed, parsed))}
+    else:
+        distribution = parsed["severity_distribution"]
+        result = {"analysis_chars": len(report.generate_ai_analysis(
+            distribution["error"], distribution["warning"], distribution["note"], parsed, parsed))}
+
+    elapsed = time.perf_counter() - start
+    measurement = {"wall_seconds": round(elapsed, 6)}
+    if trace:
+        measurement["tracemalloc_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 1024 / 1024, 2)
+        tracemalloc.stop()
+    else:
+        # ru_maxrss는 Linux에서 KB 단위
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        measurement["peak_rss_mb"] = round(rss_after / 1024, 2)
+        measurement["peak_rss_growth_mb"] = round((rss_after - rss_before) / 1024, 2)
+    if "error" in result:
+        measurement["error"] = result["error"]
+    return measurement
+
+
+def measure_stage(stage: str, sarif_path: str, tracemalloc_enabled: bool = True) -> Dict:
+    """단계를 새 프로세스에서 실행하여 다른 단계의 메모리 사용량이 섞이지 않도록 측정합니다.
+
+    tracemalloc은 실행 속도를 떨어뜨리므로 시간/RSS 측정과 별도 프로세스에서 한 번 더 실행합니다.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(1) as pool:
+        measurement = pool.apply(_run_stage, (stage, sarif_path, False))
+    if tracemalloc_enabled:
+        with ctx.Pool(1) as pool:
+            traced = pool.apply(_run_stage, (stage, sarif_path, True))
+        measurement["tracemalloc_peak_mb"] = traced["tracemalloc_peak_mb"]
+    return measurement
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(sizes: List[int], stages: List[str], workdir: str, seed: int,
+                   tracemalloc_enabled: bool = True) -> Dict:
+    """크기별 합성 SARIF를 (없으면) 만들고 각 단계를 측정하여 결과 문서를 반환합니다."""
+    os.makedirs(workdir, exist_ok=True)
+    results = []
+    for size in sizes:
+        sarif_path = os.path.join(workdir, f"synthetic-{size}-seed{seed}.sarif")
+        if not os.path.exists(sarif_path):
+            print(f"🧪 합성 SARIF 생성: {size}개 결과 → {sarif_path}")
+            generate_synthetic_sarif(sarif_path, size, seed)
+        file_mb = round(os.path.getsize(sarif_path) / 1024 / 1024, 2)
+        for stage in stages:
+            measurement = measure_stage(stage, sarif_path, tracemalloc_enabled)
+            measurement.update({"stage": stage, "results": size, "file_mb": file_mb})
+            results.append(measurement)
+            line = (f"⏱️  {stage:<13} {size:>9}개  {measurement['wall_seconds']:>10.4f}s  "
+                    f"RSS {measurement['peak_rss_mb']:>9.1f}MB")
+            if "tracemalloc_peak_mb" in measurement:
+                line += f"  tracemalloc {measurement['tracemalloc_peak_mb']:>9.1f}MB"
+            print(line)
+    return {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": seed,
+        "results": results
+    }
+
+
+def compare_results(previous: Dict, current: Dict) -> None:
+    """이전 결과 파일과 단계·크기별로 비교한 표를 출력합니다 (비율 < 1이면 개선)."""
+    before = {(r["stage"], r["results"]): r for r in previous.get("results", [])}
+    print(f"\n📈 비교: {previous.get('commit')} → {current.get('commit')} (현재/이전 비율)")
+    for r in current["results"]:
+        old = before.get((r["stage"], r["results"]))
+        if old is None:
+            continue
+        ratios = []
+        for key in ("wall_seconds", "peak_rss_mb", "tracemalloc_peak_mb"):
+            if old.get(key) and key in r:
+                ratios.append(f"{key} x{r[key] / old[key]:.2f}")
+        print(f"  {r['stage']:<13} {r['results']:>9}개  " + ", ".join(ratios))
+
+
+def main(argv: Optional[List[str]] = None):
+    """벤치마크 실행을 위한 메인 함수입니다."""
+    parser = argparse.ArgumentParser(description="generate_security_report.py 단계별 성능을 측정합니다.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"SARIF 결과 개수 목록 (기본값: {DEFAULT_SIZES})")
+    parser.add_argument("--stages", default=DEFAULT_STAGES, help=f"측정할 단계 목록 (기본값: {DEFAULT_STAGES})")
+    parser.add_argument("--seed", type=int, default=42, help="합성 데이터 seed (기본값: 42)")
+    parser.add_argument("--workdir", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), ".bench"),
+                        help="합성 SARIF 파일을 저장/재사용할 디렉토리 (기본값: 스크립트 위치의 .bench)")
+    parser.add_argument("--output", default="bench-results.json", help="결과 JSON 파일 (기본값: bench-results.json)")
+    parser.add_argument("--compare", metavar="PATH", default=None, help="이전 결과 JSON과 비교하여 출력합니다")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="tracemalloc 측정을 생략합니다 (더 빠름)")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    stages = [stage.strip() for stage in args.stages.split(",") if stage.strip()]
+    unknown = [stage for stage in stages if stage not in STAGES]
+    if unknown:
+        parser.error(f"알 수 없는 단계: {', '.join(unknown)} (사용 가능: {', '.join(STAGES)})")
+
+    document = run_benchmarks(sizes, stages, args.workdir, args.seed, not args.no_tracemalloc)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(document, f, ensure_ascii=False, indent=2)
+    print(f"✅ 벤치마크 결과 저장: {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare_results(json.load(f), document)
+
+if __name__ == "__main__":
+    main()
@@ -4,46 +4,922 @@ Trivy Security Report Generator
 Trivy 스캔 결과를 파싱하고 AI 기반 종합 보안 보고서를 생성합니다.
 """
 
+import argparse
+import glob
+import hashlib
+import heapq
 import json
 import os
+import re
+import struct
 import sys
+import zlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from html import escape
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
 
-def parse_sarif_file(file_path: str) -> Dict:
-    """SARIF 파일을 파싱하고 취약점 정보를 추출합니다."""
+# 스트리밍 파싱 시 한 번에 읽어들이는 바이트 수
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# 보고서에 표시되는 심각도별 최대 항목 수 (generate_ai_analysis의 최대 표시 개수)
+REPORT_SAMPLE_LIMIT = 8
+
+# 보고서의 "주요 파일" 안내에 필요한 최대 파일 수
+REPORT_FILE_LIMIT = 3
+
+# 보고서 파일 쓰기 버퍼 크기
+REPORT_WRITE_BUFFER = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_STRUCTURAL_RE = re.compile(r'["\[\]{}]')
+# 버퍼 끝까지 숫자를 이루는 문자만 남아 있으면 숫자가 다음 청크로 이어질 수 있음 (1. / 1e / -2. 등)
+_NUMBER_TAIL_RE = re.compile(r"[0-9.eE+-]*\Z")
+_STRING_END_RE = re.compile(r'(?:[^"\\]|\\.)*"', re.S)
+
+
+class _JsonStreamReader:
+    """큰 JSON 문서를 청크 단위로 읽으면서 필요한 값만 디코딩하는 최소한의 풀(pull) 리더입니다."""
+
+    def __init__(self, f, chunk_size: int = STREAM_CHUNK_SIZE):
+        self._f = f
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """버퍼에 다음 청크를 추가합니다. 더 읽을 데이터가 없으면 False를 반환합니다."""
+        if self._eof:
+            return False
+        chunk = self._f.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        if self._pos > len(self._buf) // 2:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        self._buf += chunk
+        return True
+
+    def peek(self) -> str:
+        """공백을 건너뛰고 다음 문자를 반환합니다 (소비하지 않음). 끝이면 빈 문자열입니다."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"JSON 구조 오류: '{char}' 예상 위치에서 '{self.peek()}' 발견")
+        self._pos += 1
+
+    def consume_separator(self, closing: str) -> bool:
+        """','를 소비하면 True, 닫는 괄호를 소비하면 False를 반환합니다."""
+        char = self.peek()
+        self._pos += 1
+        if char == ",":
+            return True
+        if char == closing:
+            return False
+        raise ValueError(f"JSON 구조 오류: ',' 또는 '{closing}' 예상 위치에서 '{char}' 발견")
+
+    def read_value(self):
+        """다음 JSON 값 하나를 디코딩하여 반환합니다."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # 숫자/리터럴은 청크 경계에서 잘려도 디코딩에 성공하므로 뒤에 구분자가 올 때까지 더 읽음
+            if end == len(self._buf) or (isinstance(value, (int, float))
+                                         and _NUMBER_TAIL_RE.match(self._buf, end)):
+                if self._fill():
+                    continue
+            self._pos = end
+            return value
+
+    def skip_value(self) -> None:
+        """다음 JSON 값을 메모리에 올리지 않고 건너뜁니다."""
+        char = self.peek()
+        if char == '"':
+            self._pos += 1
+            self._skip_string_body()
+            return
+        if char not in "[{":
+            self.read_value()
+            return
+        depth = 0
+        while True:
+            match = _STRUCTURAL_RE.search(self._buf, self._pos)
+            if match is None:
+                self._pos = len(self._buf)
+                if not self._fill():
+                    raise ValueError("JSON 구조 오류: 예기치 않은 파일 끝")
+                continue
+            self._pos = match.end()
+            token = match.group()
+            if token == '"':
+                self._skip_string_body()
+            elif token in "[{":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def _skip_string_body(self) -> None:
+        """여는 따옴표 다음 위치에서 닫는 따옴표 다음까지 이동합니다."""
+        while True:
+            match = _STRING_END_RE.match(self._buf, self._pos)
+            if match is not None:
+                self._pos = match.end()
+                return
+            if not self._fill():
+                raise ValueError("JSON 구조 오류: 닫히지 않은 문자열")
+
+    def iter_object_keys(self):
+        """현재 객체의 키를 차례로 반환합니다. 호출자는 각 키의 값을 읽거나 건너뛰어야 합니다."""
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.read_value()
+            self.expect(":")
+            yield key
+            if not self.consume_separator("}"):
+                return
+
+    def iter_array(self):
+        """현재 배열의 각 원소 위치에서 멈춥니다. 호출자는 각 원소를 읽거나 건너뛰어야 합니다."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield
+            if not self.consume_separator("]"):
+                return
+
+
+def iter_sarif_results(file_path: str):
+    """SARIF 파일의 runs[].results[] 항목을 하나씩 스트리밍으로 반환합니다.
+
+    result 객체 하나만 메모리에 올리므로, 파일 크기와 관계없이 메모리 사용량이 일정합니다.
+    tool.driver.rules 등 보고서에 필요 없는 값은 디코딩하지 않고 건너뜁니다.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        reader = _JsonStreamReader(f)
+        for key in reader.iter_object_keys():
+            if key != "runs":
+                reader.skip_value()
+                continue
+            for _ in reader.iter_array():
+                for run_key in reader.iter_object_keys():
+                    if run_key != "results":
+                        reader.skip_value()
+                        continue
+                    for _ in reader.iter_array():
+                        yield reader.read_value()
+
+
+# 심각도 문자열 <-> 정수 코드 (FindingStore에는 코드만 저장)
+SEVERITY_LEVELS = ("error", "warning", "note", "none")
+SEVERITY_CODES = {severity: code for code, severity in enumerate(SEVERITY_LEVELS)}
+
+
+# 취약점 fingerprint 길이(바이트). 실행 간 같은 취약점을 식별하는 데 사용
+FINGERPRINT_SIZE = 16
+
+
+def finding_fingerprint(rule_id: str, location: str, message: str,
+                        partial_fingerprints: Optional[Dict] = None) -> bytes:
+    """취약점의 fingerprint를 계산합니다.
+
+    SARIF partialFingerprints가 있으면 rule ID와 함께 사용하고,
+    없으면 rule ID + 위치 + 메시지로 계산합니다.
+    """
+    if partial_fingerprints:
+        parts = [rule_id] + [f"{key}={value}" for key, value in sorted(partial_fingerprints.items())]
+    else:
+        parts = [rule_id, location, message]
+    return hashlib.blake2b("\0".join(parts).encode('utf-8'), digest_size=FINGERPRINT_SIZE).digest()
+
+
+class Finding:
+    """FindingStore에서 꺼낸 취약점 하나를 나타내는 경량 레코드입니다."""
+
+    __slots__ = ("message", "severity", "location", "rule_id", "fingerprint")
+
+    def __init__(self, message: str, severity: str, location: str, rule_id: str, fingerprint: str = ""):
+        self.message = message
+        self.severity = severity
+        self.location = location
+        self.rule_id = rule_id
+        self.fingerprint = fingerprint
+
+    def to_dict(self) -> Dict:
+        return {
+            "message": self.message,
+            "severity": self.severity,
+            "location": self.location,
+            "rule_id": self.rule_id,
+            "fingerprint": self.fingerprint
+        }
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Finding):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"Finding({self.rule_id!r}, {self.severity!r}, {self.location!r})"
+
+
+class FindingStore:
+    """취약점 목록을 컬럼 배열로 저장하는 압축 컨테이너입니다.
+
+    취약점마다 dict를 만드는 대신 심각도는 1바이트 코드로, rule ID·경로·메시지는
+    공유 문자열 테이블의 인덱스(4바이트)로 저장합니다. 같은 문자열은 한 번만 보관됩니다.
+    fingerprint는 취약점마다 FINGERPRINT_SIZE 바이트씩 이어 붙여 저장합니다.
+    len()과 반복을 지원하며, 반복 시 Finding 레코드를 그때그때 만들어 반환합니다.
+    """
+
+    __slots__ = ("_severities", "_rule_ids", "_locations", "_messages", "_fingerprints",
+                 "_strings", "_string_ids")
+
+    def __init__(self):
+        self._severities = array('B')
+        self._rule_ids = array('I')
+        self._locations = array('I')
+        self._messages = array('I')
+        self._fingerprints = array('B')
+        self._strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+
+    def _intern(self, value: str) -> int:
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings.append(value)
+            self._string_ids[value] = string_id
+        return string_id
+
+    def append(self, message: str, severity: str, location: str, rule_id: str,
+               fingerprint: Optional[bytes] = None) -> int:
+        """취약점 하나를 추가하고 저장된 위치(인덱스)를 반환합니다.
+
+        fingerprint를 지정하지 않으면 rule ID + 위치 + 메시지로 계산합니다.
+        """
+        self._severities.append(SEVERITY_CODES[severity])
+        self._rule_ids.append(self._intern(rule_id))
+        self._locations.append(self._intern(location))
+        self._messages.append(self._intern(message))
+        self._fingerprints.frombytes(fingerprint or finding_fingerprint(rule_id, location, message))
+        return len(self._severities) - 1
+
+    def extend(self, other: "FindingStore") -> int:
+        """다른 저장소의 취약점을 모두 뒤에 덧붙이고, 덧붙인 첫 위치(offset)를 반환합니다."""
+        offset = len(self)
+        remap = [self._intern(value) for value in other._strings]
+        self._severities.extend(other._severities)
+        self._rule_ids.extend(array('I', (remap[i] for i in other._rule_ids)))
+        self._locations.extend(array('I', (remap[i] for i in other._locations)))
+        self._messages.extend(array('I', (remap[i] for i in other._messages)))
+        self._fingerprints.extend(other._fingerprints)
+        return offset
+
+    def severity_code(self, index: int) -> int:
+        return self._severities[index]
+
+    def fingerprint(self, index: int) -> bytes:
+        start = index * FINGERPRINT_SIZE
+        return self._fingerprints[start:start + FINGERPRINT_SIZE].tobytes()
+
+    def __len__(self) -> int:
+        return len(self._severities)
+
+    def __getitem__(self, index: int) -> Finding:
+        strings = self._strings
+        return Finding(strings[self._messages[index]], SEVERITY_LEVELS[self._severities[index]],
+                       strings[self._locations[index]], strings[self._rule_ids[index]],
+                       self.fingerprint(index).hex())
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+class FindingsIndex:
+    """파싱 시 한 번의 순회로 만들어지는 심각도·파일·rule별 취약점 인덱스입니다.
+
+    각 버킷은 FindingStore 안의 위치(array)를 보관하므로 보고서 섹션은 전체 목록을
+    다시 훑지 않고 조회만 하면 됩니다. bucket_limit을 지정하면 버킷마다 그 개수까지만
+    위치를 보관하고, 개수(count)는 항상 전체 기준으로 집계합니다 (스트리밍 모드용).
+    """
+
+    __slots__ = ("store", "bucket_limit", "severity_counts", "by_severity",
+                 "file_counts", "by_file", "rule_counts", "by_rule")
+
+    def __init__(self, store: FindingStore, bucket_limit: Optional[int] = None):
+        self.store = store
+        self.bucket_limit = bucket_limit
+        self.severity_counts = [0] * len(SEVERITY_LEVELS)
+        self.by_severity = [array('I') for _ in SEVERITY_LEVELS]
+        self.file_counts: Dict[str, int] = {}
+        self.by_file: Dict[str, array] = {}
+        self.rule_counts: Dict[str, int] = {}
+        self.by_rule: Dict[str, array] = {}
+
+    def wants(self, severity: str) -> bool:
+        """해당 심각도 버킷에 위치를 더 보관할 수 있는지 여부입니다."""
+        return self.bucket_limit is None or len(self.by_severity[SEVERITY_CODES[severity]]) < self.bucket_limit
+
+    def add(self, severity: str, location: str, rule_id: str, position: Optional[int] = None) -> None:
+        """취약점 하나를 집계합니다. position이 None이면 개수만 갱신합니다."""
+        code = SEVERITY_CODES[severity]
+        self.severity_counts[code] += 1
+        self.file_counts[location] = self.file_counts.get(location, 0) + 1
+        self.rule_counts[rule_id] = self.rule_counts.get(rule_id, 0) + 1
+        if position is None:
+            return
+        limit = self.bucket_limit
+        for bucket in (self.by_severity[code],
+                       self.by_file.setdefault(location, array('I')),
+                       self.by_rule.setdefault(rule_id, array('I'))):
+            if limit is None or len(bucket) < limit:
+                bucket.append(position)
+
+    def merge(self, other: "FindingsIndex", offset: int) -> None:
+        """다른 인덱스를 합칩니다. other의 위치는 이 인덱스의 저장소 기준으로 offset만큼 이동됩니다."""
+        limit = self.bucket_limit
+        
+        def extend_bucket(bucket: array, positions: array) -> None:
+            if limit is not None:
+                positions = positions[:max(limit - len(bucket), 0)]
+            bucket.extend(array('I', (p + offset for p in positions)))
+        
+        for code, count in enumerate(other.severity_counts):
+            self.severity_counts[code] += count
+            extend_bucket(self.by_severity[code], other.by_severity[code])
+        for counts, buckets, other_counts, other_buckets in (
+                (self.file_counts, self.by_file, other.file_counts, other.by_file),
+                (self.rule_counts, self.by_rule, other.rule_counts, other.by_rule)):
+            for key, count in other_counts.items():
+                counts[key] = counts.get(key, 0) + count
+            for key, positions in other_buckets.items():
+                extend_bucket(buckets.setdefault(key, array('I')), positions)
+
+    def __len__(self) -> int:
+        return sum(self.severity_counts)
+
+    def count(self, severity: str) -> int:
+        return self.severity_counts[SEVERITY_CODES[severity]]
+
+    def severity_distribution(self) -> Dict[str, int]:
+        return dict(zip(SEVERITY_LEVELS, self.severity_counts))
+
+    def top(self, severity: str, limit: int) -> List[Finding]:
+        """해당 심각도에서 처음 발견된 순서대로 최대 limit개의 취약점을 반환합니다."""
+        positions = self.by_severity[SEVERITY_CODES[severity]][:limit]
+        return [self.store[i] for i in positions]
+
+    def files(self, limit: Optional[int] = None) -> List[str]:
+        """취약점이 발견된 파일을 처음 발견된 순서대로 반환합니다."""
+        files = iter(self.file_counts)
+        return list(files if limit is None else islice(files, limit))
+
+    def findings_in_file(self, location: str) -> List[Finding]:
+        return [self.store[i] for i in self.by_file.get(location, ())]
+
+    def findings_for_rule(self, rule_id: str) -> List[Finding]:
+        return [self.store[i] for i in self.by_rule.get(rule_id, ())]
+
+
+def _extract_result(result: Dict) -> Tuple[str, str, str, str]:
+    """SARIF result 객체에서 보고서에 필요한 (메시지, 심각도, 위치, rule ID)만 추출합니다."""
+    return (
+        result.get("message", {}).get("text", "설명 없음"),
+        result.get("level", "none"),
+        result.get("locations", [{}])[0].get("physicalLocation", {}).get("artifactLocation", {}).get("uri", "알 수 없음"),
+        result.get("ruleId", "알 수 없음")
+    )
+
+
+def _index_results(results, bucket_limit: Optional[int] = None) -> Dict:
+    """SARIF result 객체들을 한 번 순회하면서 FindingStore와 FindingsIndex를 함께 만듭니다.
+
+    bucket_limit이 지정되면 인덱스 버킷에 들어가는 취약점만 저장소에 보관합니다.
+    """
+    store = FindingStore()
+    index = FindingsIndex(store, bucket_limit)
+    for result in results:
+        message, severity, location, rule_id = _extract_result(result)
+        position = None
+        if index.wants(severity):
+            fingerprint = finding_fingerprint(rule_id, location, message, result.get("partialFingerprints"))
+            position = store.append(message, severity, location, rule_id, fingerprint)
+        index.add(severity, location, rule_id, position)
+    return {
+        "total_vulnerabilities": len(index),
+        "severity_distribution": index.severity_distribution(),
+        "all_vulnerabilities": store,  # 스트리밍 모드에서는 인덱스 버킷에 포함된 취약점만
+        "index": index
+    }
+
+
+MISSING_FILE_ERROR = "파일을 찾을 수 없습니다"
+
+
+def parse_sarif_file(file_path: str, streaming: bool = False) -> Dict:
+    """SARIF 파일을 파싱하고 취약점 정보를 추출합니다.
+
+    취약점 목록은 FindingStore로, 심각도·파일·rule별 그룹은 FindingsIndex로 반환됩니다.
+    streaming=True이면 파일 전체를 메모리에 올리지 않고 results를 하나씩 읽으면서
+    카운터를 갱신하고, 보고서에 표시되는 만큼의 취약점만 보관합니다.
+    """
     if not os.path.exists(file_path):
-        return {"error": "파일을 찾을 수 없습니다"}
+        return {"error": MISSING_FILE_ERROR}
     
     try:
+        if streaming:
+            return _index_results(iter_sarif_results(file_path), bucket_limit=REPORT_SAMPLE_LIMIT)
+        
         with open(file_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
         
-        results = []
-        severity_counts = {"error": 0, "warning": 0, "note": 0, "none": 0}
-        
-        for run in data.get("runs", []):
-            for result in run.get("results", []):
-                severity = result.get("level", "none")
-                severity_counts[severity] += 1
-                
-                results.append({
-                    "message": result.get("message", {}).get("text", "설명 없음"),
-                    "severity": severity,
-                    "location": result.get("locations", [{}])[0].get("physicalLocation", {}).get("artifactLocation", {}).get("uri", "알 수 없음"),
-                    "rule_id": result.get("ruleId", "알 수 없음")
-                })
-        
-        return {
-            "total_vulnerabilities": len(results),
-            "severity_distribution": severity_counts,
-            "all_vulnerabilities": results  # 모든 취약점 포함
-        }
+        return _index_results(result for run in data.get("runs", []) for result in run.get("results", []))
     except Exception as e:
         return {"error": f"SARIF 파일 파싱 실패: {str(e)}"}
 
-def generate_ai_report(trivy_fs_results: Dict, trivy_iac_results: Dict) -> str:
-    """AI 기반 보안 보고서를 생성합니다."""
+# 스캔 카테고리 (보고서의 "스캔 도구별 결과" 섹션 순서)
+SCAN_CATEGORIES = ("fs", "iac")
+
+# 파일 이름에 이 단어가 포함되면 인프라스트럭처 코드(IaC) 스캔 결과로 분류
+_IAC_NAME_HINTS = ("iac", "config", "terraform")
+
+
+def expand_sarif_inputs(inputs: List[str]) -> List[str]:
+    """파일·디렉토리·glob 패턴 목록을 SARIF 파일 경로 목록으로 펼칩니다 (중복 제거, 순서 유지).
+
+    디렉토리는 하위 디렉토리까지 *.sarif 파일을 찾습니다. 존재하지 않는 일반 경로는
+    그대로 남겨 보고서에 "파일을 찾을 수 없습니다"로 표시되도록 합니다.
+    """
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.extend(sorted(glob.glob(os.path.join(item, "**", "*.sarif"), recursive=True)))
+        elif glob.has_magic(item):
+            paths.extend(sorted(glob.glob(item, recursive=True)))
+        else:
+            paths.append(item)
+    return list(dict.fromkeys(paths))
+
+
+def scan_category(file_path: str) -> str:
+    """SARIF 파일 이름으로 스캔 카테고리("fs" 또는 "iac")를 판단합니다."""
+    name = os.path.basename(file_path).lower()
+    return "iac" if any(hint in name for hint in _IAC_NAME_HINTS) else "fs"
+
+
+def evaluate_gate(file_paths: List[str], max_errors: int = 0,
+                  max_warnings: Optional[int] = None) -> Tuple[Optional[bool], Dict]:
+    """SARIF 파일들을 스트리밍으로 읽으면서 통과/실패를 판정합니다.
+
+    error 수가 max_errors를 넘거나 warning 수가 max_warnings를 넘는 순간 나머지 입력은 읽지 않고
+    실패로 판정합니다. 통과는 모든 입력을 끝까지 읽어야 판정할 수 있습니다.
+    파일이 없거나 파싱에 실패하면 판정 불가(None)를 반환합니다.
+    """
+    counts = {"error": 0, "warning": 0}
+    details = {"counts": counts, "scanned_results": 0, "scanned_files": 0, "stopped_at": None, "error": None}
+    for file_path in file_paths:
+        if not os.path.exists(file_path):
+            details["error"] = f"{file_path}: 파일을 찾을 수 없습니다"
+            return None, details
+        details["scanned_files"] += 1
+        try:
+            for result in iter_sarif_results(file_path):
+                details["scanned_results"] += 1
+                level = result.get("level", "none")
+                if level not in counts:
+                    continue
+                counts[level] += 1
+                if counts["error"] > max_errors or (max_warnings is not None and counts["warning"] > max_warnings):
+                    details["stopped_at"] = file_path
+                    return False, details
+        except Exception as e:
+            details["error"] = f"{file_path}: SARIF 파일 파싱 실패: {str(e)}"
+            return None, details
+    return True, details
+
+
+# 캐시 파일 형식 버전 (FindingStore/FindingsIndex 구조가 바뀌면 올려서 기존 캐시를 무효화)
+CACHE_FORMAT_VERSION = 2
+CACHE_MAGIC = b"SARIFCACHE"
+CACHE_SUFFIX = ".bin"
+DEFAULT_CACHE_MAX_MB = 512
+
+
+def _file_sha256(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def encode_scan_result(result: Dict) -> bytes:
+    """parse_sarif_file 결과(FindingStore + FindingsIndex)를 압축된 바이너리로 직렬화합니다.
+
+    문자열 테이블과 카운트는 JSON 헤더에, 위치/코드 컬럼은 array 원본 바이트로 저장합니다.
+    """
+    store = result["all_vulnerabilities"]
+    index = result["index"]
+    file_keys = list(index.file_counts)
+    rule_keys = list(index.rule_counts)
+    arrays = [store._severities, store._rule_ids, store._locations, store._messages, store._fingerprints]
+    arrays += index.by_severity
+    arrays += [index.by_file.get(key, array('I')) for key in file_keys]
+    arrays += [index.by_rule.get(key, array('I')) for key in rule_keys]
+    header = json.dumps({
+        "strings": store._strings,
+        "bucket_limit": index.bucket_limit,
+        "severity_counts": index.severity_counts,
+        "files": [file_keys, [index.file_counts[key] for key in file_keys]],
+        "rules": [rule_keys, [index.rule_counts[key] for key in rule_keys]],
+        "arrays": [[a.typecode, len(a)] for a in arrays]
+    }, ensure_ascii=False).encode('utf-8')
+    payload = b"".join([struct.pack("<I", len(header)), header] + [a.tobytes() for a in arrays])
+    return CACHE_MAGIC + struct.pack("<I", CACHE_FORMAT_VERSION) + zlib.compress(payload, 1)
+
+
+def decode_scan_result(data: bytes) -> Dict:
+    """encode_scan_result로 직렬화된 바이너리를 parse_sarif_file 결과 형태로 복원합니다."""
+    prefix = len(CACHE_MAGIC)
+    if data[:prefix] != CACHE_MAGIC or struct.unpack_from("<I", data, prefix)[0] != CACHE_FORMAT_VERSION:
+        raise ValueError("지원하지 않는 캐시 형식")
+    payload = zlib.decompress(data[prefix + 4:])
+    header_len = struct.unpack_from("<I", payload)[0]
+    header = json.loads(payload[4:4 + header_len].decode('utf-8'))
+    
+    arrays = []
+    offset = 4 + header_len
+    for typecode, length in header["arrays"]:
+        column = array(typecode)
+        end = offset + length * column.itemsize
+        column.frombytes(payload[offset:end])
+        arrays.append(column)
+        offset = end
+    
+    store = FindingStore()
+    store._severities, store._rule_ids, store._locations, store._messages, store._fingerprints = arrays[:5]
+    store._strings = header["strings"]
+    store._string_ids = {value: i for i, value in enumerate(store._strings)}
+    
+    index = FindingsIndex(store, header["bucket_limit"])
+    index.severity_counts = header["severity_counts"]
+    index.by_severity = arrays[5:5 + len(SEVERITY_LEVELS)]
+    buckets = iter(arrays[5 + len(SEVERITY_LEVELS):])
+    for counts, by_key, (keys, values) in ((index.file_counts, index.by_file, header["files"]),
+                                           (index.rule_counts, index.by_rule, header["rules"])):
+        for key, count in zip(keys, values):
+            counts[key] = count
+            by_key[key] = next(buckets)
+    
+    return {
+        "total_vulnerabilities": len(index),
+        "severity_distribution": index.severity_distribution(),
+        "all_vulnerabilities": store,
+        "index": index
+    }
+
+
+class SarifCache:
+    """SARIF 파일 내용의 SHA-256을 키로 파싱 결과를 디스크에 보관하는 캐시입니다.
+
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다.
+    프로세스 풀의 워커는 load/store만 사용하고, 통계와 정리(evict)는 메인 프로세스에서 합니다.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_CACHE_MAX_MB * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, file_path: str, streaming: bool) -> str:
+        # 스트리밍 모드는 심각도별 일부만 저장하므로 전체 모드와 별도 키를 사용
+        return f"{_file_sha256(file_path)}-{'stream' if streaming else 'full'}"
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + CACHE_SUFFIX)
+
+    def load(self, key: str) -> Optional[Dict]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                result = decode_scan_result(f.read())
+        except (OSError, ValueError, zlib.error):
+            return None
+        os.utime(path)  # LRU 정리를 위해 마지막 사용 시각 갱신
+        return result
+
+    def store(self, key: str, result: Dict) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(encode_scan_result(result))
+        os.replace(tmp_path, path)
+
+    def record(self, status: Optional[str]) -> None:
+        if status == "hit":
+            self.hits += 1
+        elif status == "miss":
+            self.misses += 1
+
+    def evict(self) -> int:
+        """전체 캐시 크기가 max_bytes 이하가 되도록 오래된 항목을 삭제하고 삭제 개수를 반환합니다."""
+        if not os.path.isdir(self.cache_dir):
+            return 0
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(CACHE_SUFFIX):
+                stat = os.stat(os.path.join(self.cache_dir, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(os.path.join(self.cache_dir, name))
+            total -= size
+            removed += 1
+        return removed
+
+
+def _parse_sarif_worker(task: Tuple[str, bool, Optional[SarifCache]]) -> Tuple[Dict, Optional[str]]:
+    """프로세스 풀에서 실행되는 parse_sarif_file 래퍼입니다. (결과, 캐시 상태)를 반환합니다."""
+    file_path, streaming, cache = task
+    if cache is None or not os.path.exists(file_path):
+        return parse_sarif_file(file_path, streaming=streaming), None
+    key = cache.key(file_path, streaming)
+    result = cache.load(key)
+    if result is not None:
+        return result, "hit"
+    result = parse_sarif_file(file_path, streaming=streaming)
+    if "error" not in result:
+        cache.store(key, result)
+    return result, "miss"
+
+
+def parse_sarif_files(file_paths: List[str], streaming: bool = False, jobs: Optional[int] = None,
+                      cache: Optional[SarifCache] = None) -> List[Tuple[str, Dict]]:
+    """여러 SARIF 파일을 프로세스 풀에서 병렬로 파싱하고 (경로, 결과) 목록을 입력 순서대로 반환합니다.
+
+    cache가 주어지면 내용이 같은 파일은 다시 파싱하지 않고 캐시에서 읽습니다.
+    """
+    tasks = [(path, streaming, cache) for path in file_paths]
+    jobs = min(jobs or os.cpu_count() or 1, len(tasks))
+    if jobs <= 1:
+        outcomes = [_parse_sarif_worker(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            outcomes = list(executor.map(_parse_sarif_worker, tasks))
+    
+    parsed = []
+    for path, (result, status) in zip(file_paths, outcomes):
+        if cache is not None:
+            cache.record(status)
+        parsed.append((path, result))
+    return parsed
+
+
+def merge_scan_results(parts: List[Tuple[str, Dict]]) -> Dict:
+    """같은 카테고리에 속한 파일별 파싱 결과를 하나의 결과로 합칩니다.
+
+    파일이 하나뿐이면 그 결과를 그대로 사용하고, 모든 파일이 실패하면 첫 번째 오류를 반환합니다.
+    합쳐진 결과의 "sources"에는 파일별 취약점 수 또는 오류가 기록됩니다.
+    """
+    if not parts:
+        return {"error": MISSING_FILE_ERROR}
+    succeeded = [(path, result) for path, result in parts if "error" not in result]
+    if len(parts) == 1 or not succeeded:
+        return parts[0][1]
+    
+    first_index = succeeded[0][1]["index"]
+    store = FindingStore()
+    index = FindingsIndex(store, first_index.bucket_limit)
+    for _, result in succeeded:
+        offset = store.extend(result["all_vulnerabilities"])
+        index.merge(result["index"], offset)
+    
+    return {
+        "total_vulnerabilities": len(index),
+        "severity_distribution": index.severity_distribution(),
+        "all_vulnerabilities": store,
+        "index": index,
+        "sources": [(path, result.get("error", result.get("total_vulnerabilities", 0))) for path, result in parts]
+    }
+
+
+def _format_sources(scan: Dict) -> str:
+    """여러 파일을 합친 결과라면 파일별 결과 목록을 마크다운으로 반환합니다."""
+    sources = scan.get("sources")
+    if not sources:
+        return ""
+    lines = [f"* **입력 파일**: {len(sources)}개\n"]
+    for path, outcome in sources:
+        if isinstance(outcome, str):
+            lines.append(f"    * `{path}`: ❌ {outcome}\n")
+        else:
+            lines.append(f"    * `{path}`: {outcome}개\n")
+    return "".join(lines)
+
+
+# 보고서에 표시되는 심각도 이름
+SEVERITY_LABELS = {"error": "높음", "warning": "중간", "note": "낮음", "none": "없음"}
+
+# 보고서의 베이스라인 비교 섹션에 표시되는 신규/해결 취약점 최대 개수
+BASELINE_REPORT_LIMIT = 20
+
+SCAN_CATEGORY_LABELS = {"fs": "파일 시스템", "iac": "IaC"}
+
+
+def _finding_record(category: str, finding: Finding) -> str:
+    """취약점 하나를 JSONL 한 줄로 직렬화합니다 (export_findings / jsonl 출력 공통 형식)."""
+    record = finding.to_dict()
+    record["category"] = category
+    return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def export_findings(scans: Dict[str, Dict], output_path: str) -> int:
+    """카테고리별 파싱 결과의 모든 취약점을 JSONL로 내보내고 내보낸 개수를 반환합니다.
+
+    다음 실행에서 --baseline으로 넘겨 신규/해결 취약점을 비교하는 데 사용합니다.
+    """
+    return render_outputs(scans, [("jsonl", output_path)])
+
+
+def load_baseline(baseline_path: str) -> Dict[str, FindingStore]:
+    """export_findings로 내보낸 JSONL을 카테고리별 FindingStore로 읽어들입니다."""
+    baseline: Dict[str, FindingStore] = {}
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            store = baseline.setdefault(record.get("category", "fs"), FindingStore())
+            fingerprint = record.get("fingerprint")
+            store.append(record["message"], record["severity"], record["location"], record["rule_id"],
+                         bytes.fromhex(fingerprint) if fingerprint else None)
+    return baseline
+
+
+class BaselineDiff:
+    """베이스라인 대비 신규(new)·해결(fixed)·변경 없음(unchanged) 취약점 분류 결과입니다.
+
+    new와 fixed는 카테고리별 (FindingStore, 위치 array)로 보관합니다.
+    """
+
+    def __init__(self):
+        self.new: Dict[str, Tuple[FindingStore, array]] = {}
+        self.fixed: Dict[str, Tuple[FindingStore, array]] = {}
+        self.unchanged = 0
+        self.skipped: List[str] = []
+        self.skip_reasons: Dict[str, str] = {}
+
+    @property
+    def new_count(self) -> int:
+        return sum(len(positions) for _, positions in self.new.values())
+
+    @property
+    def fixed_count(self) -> int:
+        return sum(len(positions) for _, positions in self.fixed.values())
+
+    def top(self, kind: str, limit: int) -> List[Tuple[str, Finding]]:
+        """신규("new") 또는 해결("fixed") 취약점을 심각도 순으로 최대 limit개 반환합니다."""
+        buckets = [[] for _ in SEVERITY_LEVELS]
+        for category, (store, positions) in getattr(self, kind).items():
+            for position in positions:
+                bucket = buckets[store.severity_code(position)]
+                if len(bucket) < limit:
+                    bucket.append((category, position))
+        selected = [item for bucket in buckets for item in bucket][:limit]
+        return [(category, getattr(self, kind)[category][0][position]) for category, position in selected]
+
+
+def baseline_skip_reason(scan: Dict) -> Optional[str]:
+    """현재 결과가 베이스라인과 비교할 수 없는 상태이면 그 이유를, 비교할 수 있으면 None을 반환합니다.
+
+    입력 파일 중 하나라도 파싱에 실패하면 그 파일의 취약점이 모두 해결된 것으로 보이므로 카테고리 전체를 제외합니다.
+    """
+    if not scan or scan.get("error") == MISSING_FILE_ERROR:
+        return "입력 파일 없음"
+    if "error" in scan:
+        return "현재 스캔 결과 파싱 실패"
+    if any(isinstance(outcome, str) for _, outcome in scan.get("sources", [])):
+        return "일부 입력 파일 파싱 실패"
+    return None
+
+
+def diff_against_baseline(scans: Dict[str, Dict], baseline: Dict[str, FindingStore]) -> BaselineDiff:
+    """현재 결과와 베이스라인을 fingerprint 해시 조인으로 비교합니다 (O(n + m)).
+
+    같은 fingerprint가 여러 번 나오면 개수 단위로 짝을 맞춥니다. 입력이 없거나 일부라도 파싱에 실패한
+    카테고리는 빠진 취약점이 해결된 것으로 잘못 보고되지 않도록 비교에서 제외합니다.
+    """
+    diff = BaselineDiff()
+    for category in dict.fromkeys(list(scans) + list(baseline)):
+        scan = scans.get(category, {})
+        reason = baseline_skip_reason(scan)
+        if reason is not None:
+            diff.skipped.append(category)
+            diff.skip_reasons[category] = reason
+            continue
+        current = scan.get("all_vulnerabilities", FindingStore())
+        previous = baseline.get(category, FindingStore())
+        
+        remaining: Dict[bytes, int] = {}
+        for i in range(len(previous)):
+            fingerprint = previous.fingerprint(i)
+            remaining[fingerprint] = remaining.get(fingerprint, 0) + 1
+        
+        new_positions = array('I')
+        for i in range(len(current)):
+            fingerprint = current.fingerprint(i)
+            if remaining.get(fingerprint, 0) > 0:
+                remaining[fingerprint] -= 1
+                diff.unchanged += 1
+            else:
+                new_positions.append(i)
+        
+        fixed_positions = array('I')
+        for i in range(len(previous)):
+            fingerprint = previous.fingerprint(i)
+            if remaining.get(fingerprint, 0) > 0:
+                remaining[fingerprint] -= 1
+                fixed_positions.append(i)
+        
+        diff.new[category] = (current, new_positions)
+        diff.fixed[category] = (previous, fixed_positions)
+    return diff
+
+
+def _format_baseline_diff(diff: BaselineDiff) -> str:
+    """베이스라인 비교 결과를 보고서 맨 앞에 들어갈 마크다운 섹션으로 만듭니다."""
+    section = "### 🔄 베이스라인 대비 변경 사항\n"
+    section += f"* **신규 취약점**: {diff.new_count}개\n"
+    section += f"* **해결된 취약점**: {diff.fixed_count}개\n"
+    section += f"* **변경 없음**: {diff.unchanged}개\n"
+    for category in diff.skipped:
+        label = SCAN_CATEGORY_LABELS.get(category, category)
+        section += f"* **비교 제외**: {label} ({diff.skip_reasons[category]})\n"
+    section += "\n"
+    
+    for kind, title, total in (("new", "🆕 신규 취약점", diff.new_count),
+                               ("fixed", "✅ 해결된 취약점", diff.fixed_count)):
+        if not total:
+            continue
+        section += f"#### {title} ({total}개)\n"
+        for category, vuln in diff.top(kind, BASELINE_REPORT_LIMIT):
+            label = SCAN_CATEGORY_LABELS.get(category, category)
+            section += f"* [{SEVERITY_LABELS[vuln.severity]}] **{vuln.rule_id}** ({label}, `{vuln.location}`): {vuln.message}\n"
+        if total > BASELINE_REPORT_LIMIT:
+            section += f"* ... 및 {total - BASELINE_REPORT_LIMIT}개 더\n"
+        section += "\n"
+    
+    return section + "---\n\n"
+
+
+def generate_ai_report(trivy_fs_results: Dict, trivy_iac_results: Dict,
+                       baseline_diff: Optional[BaselineDiff] = None) -> str:
+    """AI 기반 보안 보고서를 생성합니다. 보고서 전체를 하나의 문자열로 반환합니다."""
+    return "".join(iter_ai_report(trivy_fs_results, trivy_iac_results, baseline_diff))
+
+def write_ai_report(f, trivy_fs_results: Dict, trivy_iac_results: Dict,
+                    baseline_diff: Optional[BaselineDiff] = None) -> None:
+    """AI 기반 보안 보고서를 열린 파일(또는 버퍼링된 writer)에 섹션 단위로 바로 씁니다."""
+    for chunk in iter_ai_report(trivy_fs_results, trivy_iac_results, baseline_diff):
+        f.write(chunk)
+
+def iter_ai_report(trivy_fs_results: Dict, trivy_iac_results: Dict,
+                   baseline_diff: Optional[BaselineDiff] = None) -> Iterator[str]:
+    """AI 기반 보안 보고서를 섹션 단위의 문자열 조각으로 차례로 생성합니다.
+
+    보고서 전체를 메모리에 만들지 않으므로 파일·파이프 등 원하는 곳으로 바로 흘려보낼 수 있습니다.
+    baseline_diff가 주어지면 신규/해결 취약점 섹션을 보고서 맨 앞(스캔 개요 다음)에 넣습니다.
+    """
     
     # 전체 통계 계산
     total_vulns = 0
@@ -67,10 +943,7 @@ def generate_ai_report(trivy_fs_results: Dict, trivy_iac_results: Dict) -> str:
         total_medium += severity_dist.get("warning", 0)
         total_low += severity_dist.get("note", 0)
     
-    # AI 분석 및 권장사항 생성
-    ai_analysis = generate_ai_analysis(total_high, total_medium, total_low, trivy_fs_results, trivy_iac_results)
-    
-    report = f"""## 🤖 AI 보안 스캔 보고서
+    yield f"""## 🤖 AI 보안 스캔 보고서
 
 ---
 
@@ -82,7 +955,12 @@ def generate_ai_report(trivy_fs_results: Dict, trivy_iac_results: Dict) -> str:
 
 ---
 
-### 🔍 Trivy 스캔 결과 요약
+"""
+    
+    if baseline_diff is not None:
+        yield _format_baseline_diff(baseline_diff)
+    
+    yield f"""### 🔍 Trivy 스캔 결과 요약
 
 이번 스캔에서 총 **{total_vulns}개**의 취약점이 발견되었으며, 그중 **{total_high}개는 높은 심각도**를 가진 것으로 나타났습니다.
 
@@ -98,29 +976,33 @@ def generate_ai_report(trivy_fs_results: Dict, trivy_iac_results: Dict) -> str:
 """
     
     if "error" in trivy_fs_results:
-        report += f"* **상태**: ❌ {trivy_fs_results['error']}\n"
+        yield f"* **상태**: ❌ {trivy_fs_results['error']}\n"
     else:
         vulns = trivy_fs_results.get("total_vulnerabilities", 0)
         severity_dist = trivy_fs_results.get("severity_distribution", {})
-        report += f"* **상태**: ✅ 완료\n"
-        report += f"* **발견된 취약점**: {vulns}개 (높음: {severity_dist.get('error', 0)}, 중간: {severity_dist.get('warning', 0)}, 낮음: {severity_dist.get('note', 0)})\n"
+        yield f"* **상태**: ✅ 완료\n"
+        yield f"* **발견된 취약점**: {vulns}개 (높음: {severity_dist.get('error', 0)}, 중간: {severity_dist.get('warning', 0)}, 낮음: {severity_dist.get('note', 0)})\n"
+        yield _format_sources(trivy_fs_results)
     
-    report += "\n**2. Trivy 인프라스트럭처 코드 스캔**\n"
+    yield "\n**2. Trivy 인프라스트럭처 코드 스캔**\n"
     
     if "error" in trivy_iac_results:
-        report += f"* **상태**: ❌ {trivy_iac_results['error']}\n"
+        yield f"* **상태**: ❌ {trivy_iac_results['error']}\n"
     else:
         vulns = trivy_iac_results.get("total_vulnerabilities", 0)
         severity_dist = trivy_iac_results.get("severity_distribution", {})
-        report += f"* **상태**: ✅ 완료\n"
-        report += f"* **발견된 취약점**: {vulns}개 (높음: {severity_dist.get('error', 0)}, 중간: {severity_dist.get('warning', 0)}, 낮음: {severity_dist.get('note', 0)})\n"
+        yield f"* **상태**: ✅ 완료\n"
+        yield f"* **발견된 취약점**: {vulns}개 (높음: {severity_dist.get('error', 0)}, 중간: {severity_dist.get('warning', 0)}, 낮음: {severity_dist.get('note', 0)})\n"
+        yield _format_sources(trivy_iac_results)
     
-    # AI 분석 결과 추가
-    report += f"\n---\n\n{ai_analysis}\n"
+    # AI 분석 및 권장사항 추가
+    yield "\n---\n\n"
+    yield from iter_ai_analysis(total_high, total_medium, total_low, trivy_fs_results, trivy_iac_results)
+    yield "\n"
     
     # 전체 상태
     overall_status = "✅ 통과" if total_high == 0 else "❌ 실패"
-    report += f"""
+    yield f"""
 ---
 
 ### 🚨 최종 보안 상태: {overall_status}
@@ -147,161 +1029,398 @@ def generate_ai_report(trivy_fs_results: Dict, trivy_iac_results: Dict) -> str:
 추가적으로 궁금한 점이나 특정 취약점에 대한 자세한 정보가 필요하시면 언제든지 문의해주세요.
 """
 
-    return report
-
 def generate_ai_analysis(high_count: int, medium_count: int, low_count: int, 
                         trivy_fs: Dict, trivy_iac: Dict) -> str:
     """AI 기반 보안 분석 및 권장사항을 생성합니다."""
-    
-    analysis = ""
+    return "".join(iter_ai_analysis(high_count, medium_count, low_count, trivy_fs, trivy_iac))
+
+def iter_ai_analysis(high_count: int, medium_count: int, low_count: int,
+                     trivy_fs: Dict, trivy_iac: Dict) -> Iterator[str]:
+    """AI 기반 보안 분석 및 권장사항을 문자열 조각으로 차례로 생성합니다."""
     
     # 전체 위험도 평가
     if high_count == 0 and medium_count == 0:
-        analysis += "#### 🟢 현재 보안 상태: 양호\n"
-        analysis += "현재 프로젝트의 보안 상태는 양호합니다. 발견된 취약점이 없거나 모두 낮은 심각도입니다.\n\n"
+        yield "#### 🟢 현재 보안 상태: 양호\n"
+        yield "현재 프로젝트의 보안 상태는 양호합니다. 발견된 취약점이 없거나 모두 낮은 심각도입니다.\n\n"
     elif high_count > 0:
-        analysis += f"#### 🔴 현재 보안 상태: 위험\n"
-        analysis += f"**{high_count}개의 높은 심각도 취약점**이 발견되어 **즉각적인 조치**가 필요합니다.\n\n"
+        yield f"#### 🔴 현재 보안 상태: 위험\n"
+        yield f"**{high_count}개의 높은 심각도 취약점**이 발견되어 **즉각적인 조치**가 필요합니다.\n\n"
     elif medium_count > 0:
-        analysis += f"#### 🟡 현재 보안 상태: 주의\n"
-        analysis += f"**{medium_count}개의 중간 심각도 취약점**이 발견되어 우선순위를 정해 해결해야 합니다.\n\n"
+        yield f"#### 🟡 현재 보안 상태: 주의\n"
+        yield f"**{medium_count}개의 중간 심각도 취약점**이 발견되어 우선순위를 정해 해결해야 합니다.\n\n"
     
-    analysis += "---\n\n"
+    yield "---\n\n"
     
     # 파일 시스템 스캔 분석 - 모든 취약점 포함
     if "error" not in trivy_fs and trivy_fs.get("total_vulnerabilities", 0) > 0:
-        analysis += "#### 📁 파일 시스템 취약점 상세 분석 (총 {}개)\n\n".format(trivy_fs.get("total_vulnerabilities", 0))
-        
-        # 파일별 취약점 그룹화
-        file_vulns = {}
-        for vuln in trivy_fs.get("all_vulnerabilities", []):
-            file_path = vuln['location']
-            if file_path not in file_vulns:
-                file_vulns[file_path] = []
-            file_vulns[file_path].append(vuln)
+        yield "#### 📁 파일 시스템 취약점 상세 분석 (총 {}개)\n\n".format(trivy_fs.get("total_vulnerabilities", 0))
         
         # 주요 파일 분석
-        if file_vulns:
-            main_files = list(file_vulns.keys())[:3]  # 상위 3개 파일만 표시
-            analysis += "주로 `{}` 파일에서 관련 취약점이 다수 발견되었습니다.\n\n".format(main_files[0] if main_files else "알 수 없음")
+        index = trivy_fs["index"]
+        main_files = index.files(REPORT_FILE_LIMIT)  # 상위 3개 파일만 표시
+        if main_files:
+            yield "주로 `{}` 파일에서 관련 취약점이 다수 발견되었습니다.\n\n".format(main_files[0] if main_files else "알 수 없음")
         
         # 심각도별 분류
-        high_vulns = [v for v in trivy_fs.get("all_vulnerabilities", []) if v['severity'] == 'error']
-        medium_vulns = [v for v in trivy_fs.get("all_vulnerabilities", []) if v['severity'] == 'warning']
-        low_vulns = [v for v in trivy_fs.get("all_vulnerabilities", []) if v['severity'] == 'note']
+        high_vulns = index.top('error', 5)  # 상위 5개만 표시
+        medium_vulns = index.top('warning', 5)  # 상위 5개만 표시
+        low_vulns = index.top('note', 3)  # 상위 3개만 표시
+        high_total = index.count('error')
+        medium_total = index.count('warning')
+        low_total = index.count('note')
         
-        if high_vulns:
-            analysis += "* **높음 ({}개)**\n".format(len(high_vulns))
-            for i, vuln in enumerate(high_vulns[:5], 1):  # 상위 5개만 표시
-                analysis += f"    * **{vuln['rule_id']}**: {vuln['message']}\n"
-            if len(high_vulns) > 5:
-                analysis += f"    * ... 및 {len(high_vulns) - 5}개 더\n"
-            analysis += "\n"
+        if high_total:
+            yield "* **높음 ({}개)**\n".format(high_total)
+            for vuln in high_vulns:
+                yield f"    * **{vuln.rule_id}**: {vuln.message}\n"
+            if high_total > 5:
+                yield f"    * ... 및 {high_total - 5}개 더\n"
+            yield "\n"
         
-        if medium_vulns:
-            analysis += "* **중간 ({}개)**\n".format(len(medium_vulns))
-            for i, vuln in enumerate(medium_vulns[:5], 1):  # 상위 5개만 표시
-                analysis += f"    * **{vuln['rule_id']}**: {vuln['message']}\n"
-            if len(medium_vulns) > 5:
-                analysis += f"    * ... 및 {len(medium_vulns) - 5}개 더\n"
-            analysis += "\n"
+        if medium_total:
+            yield "* **중간 ({}개)**\n".format(medium_total)
+            for vuln in medium_vulns:
+                yield f"    * **{vuln.rule_id}**: {vuln.message}\n"
+            if medium_total > 5:
+                yield f"    * ... 및 {medium_total - 5}개 더\n"
+            yield "\n"
         
-        if low_vulns:
-            analysis += "* **낮음 ({}개)**\n".format(len(low_vulns))
-            for i, vuln in enumerate(low_vulns[:3], 1):  # 상위 3개만 표시
-                analysis += f"    * **{vuln['rule_id']}**: {vuln['message']}\n"
-            if len(low_vulns) > 3:
-                analysis += f"    * ... 및 {len(low_vulns) - 3}개 더\n"
-            analysis += "\n"
+        if low_total:
+            yield "* **낮음 ({}개)**\n".format(low_total)
+            for vuln in low_vulns:
+                yield f"    * **{vuln.rule_id}**: {vuln.message}\n"
+            if low_total > 3:
+                yield f"    * ... 및 {low_total - 3}개 더\n"
+            yield "\n"
         
-        analysis += "**권장사항:**\n"
-        analysis += "* 관련된 **모든 취약 패키지를 최신 버전으로 업데이트**하세요.\n"
-        analysis += "* 더 이상 사용하지 않거나, 알려진 취약점이 지속적으로 발생하는 라이브러리는 **대체재를 검토**해 보세요.\n"
-        analysis += "* **정기적인 보안 업데이트 일정을 수립**하고, 패키지 관리 정책을 적용하여 의존성 취약점을 사전에 방지하는 것이 중요합니다.\n\n"
+        yield "**권장사항:**\n"
+        yield "* 관련된 **모든 취약 패키지를 최신 버전으로 업데이트**하세요.\n"
+        yield "* 더 이상 사용하지 않거나, 알려진 취약점이 지속적으로 발생하는 라이브러리는 **대체재를 검토**해 보세요.\n"
+        yield "* **정기적인 보안 업데이트 일정을 수립**하고, 패키지 관리 정책을 적용하여 의존성 취약점을 사전에 방지하는 것이 중요합니다.\n\n"
     
     # IaC 스캔 분석 - 모든 취약점 포함
     if "error" not in trivy_iac and trivy_iac.get("total_vulnerabilities", 0) > 0:
-        analysis += "#### 🏗️ 인프라스트럭처 코드 취약점 상세 분석 (총 {}개)\n\n".format(trivy_iac.get("total_vulnerabilities", 0))
-        
-        # 파일별 취약점 그룹화
-        file_vulns = {}
-        for vuln in trivy_iac.get("all_vulnerabilities", []):
-            file_path = vuln['location']
-            if file_path not in file_vulns:
-                file_vulns[file_path] = []
-            file_vulns[file_path].append(vuln)
+        yield "#### 🏗️ 인프라스트럭처 코드 취약점 상세 분석 (총 {}개)\n\n".format(trivy_iac.get("total_vulnerabilities", 0))
         
         # 주요 파일 분석
-        if file_vulns:
-            main_files = list(file_vulns.keys())[:3]  # 상위 3개 파일만 표시
-            analysis += "`{}` 파일에서 인프라 설정과 관련된 다수의 보안 취약점이 발견되었습니다. ".format(main_files[0] if main_files else "알 수 없음")
-            analysis += "특히, 네트워크 접근 제어 및 데이터 암호화에 대한 문제가 많습니다.\n\n"
+        index = trivy_iac["index"]
+        main_files = index.files(REPORT_FILE_LIMIT)  # 상위 3개 파일만 표시
+        if main_files:
+            yield "`{}` 파일에서 인프라 설정과 관련된 다수의 보안 취약점이 발견되었습니다. ".format(main_files[0] if main_files else "알 수 없음")
+            yield "특히, 네트워크 접근 제어 및 데이터 암호화에 대한 문제가 많습니다.\n\n"
         
         # 심각도별 분류
-        high_vulns = [v for v in trivy_iac.get("all_vulnerabilities", []) if v['severity'] == 'error']
-        medium_vulns = [v for v in trivy_iac.get("all_vulnerabilities", []) if v['severity'] == 'warning']
-        low_vulns = [v for v in trivy_iac.get("all_vulnerabilities", []) if v['severity'] == 'note']
+        high_vulns = index.top('error', 8)  # 상위 8개만 표시
+        medium_vulns = index.top('warning', 5)  # 상위 5개만 표시
+        low_vulns = index.top('note', 5)  # 상위 5개만 표시
+        high_total = index.count('error')
+        medium_total = index.count('warning')
+        low_total = index.count('note')
         
-        if high_vulns:
-            analysis += "* **높음 ({}개)**\n".format(len(high_vulns))
-            for i, vuln in enumerate(high_vulns[:8], 1):  # 상위 8개만 표시
-                analysis += f"    * **{vuln['rule_id']}**: {vuln['message']}\n"
-            if len(high_vulns) > 8:
-                analysis += f"    * ... 및 {len(high_vulns) - 8}개 더\n"
-            analysis += "\n"
+        if high_total:
+            yield "* **높음 ({}개)**\n".format(high_total)
+            for vuln in high_vulns:
+                yield f"    * **{vuln.rule_id}**: {vuln.message}\n"
+            if high_total > 8:
+                yield f"    * ... 및 {high_total - 8}개 더\n"
+            yield "\n"
         
-        if medium_vulns:
-            analysis += "* **중간 ({}개)**\n".format(len(medium_vulns))
-            for i, vuln in enumerate(medium_vulns[:5], 1):  # 상위 5개만 표시
-                analysis += f"    * **{vuln['rule_id']}**: {vuln['message']}\n"
-            if len(medium_vulns) > 5:
-                analysis += f"    * ... 및 {len(medium_vulns) - 5}개 더\n"
-            analysis += "\n"
+        if medium_total:
+            yield "* **중간 ({}개)**\n".format(medium_total)
+            for vuln in medium_vulns:
+                yield f"    * **{vuln.rule_id}**: {vuln.message}\n"
+            if medium_total > 5:
+                yield f"    * ... 및 {medium_total - 5}개 더\n"
+            yield "\n"
         
-        if low_vulns:
-            analysis += "* **낮음 ({}개)**\n".format(len(low_vulns))
-            for i, vuln in enumerate(low_vulns[:5], 1):  # 상위 5개만 표시
-                analysis += f"    * **{vuln['rule_id']}**: {vuln['message']}\n"
-            if len(low_vulns) > 5:
-                analysis += f"    * ... 및 {len(low_vulns) - 5}개 더\n"
-            analysis += "\n"
+        if low_total:
+            yield "* **낮음 ({}개)**\n".format(low_total)
+            for vuln in low_vulns:
+                yield f"    * **{vuln.rule_id}**: {vuln.message}\n"
+            if low_total > 5:
+                yield f"    * ... 및 {low_total - 5}개 더\n"
+            yield "\n"
         
-        analysis += "**권장사항:**\n"
-        analysis += "* **Terraform 설정에서 보안 모범 사례를 적극적으로 적용**하세요.\n"
-        analysis += "* **민감한 정보가 하드코딩되지 않도록 확인**하고, AWS Secrets Manager 등 안전한 서비스로 관리하세요.\n"
-        analysis += "* **최소 권한 원칙**에 따라 리소스 접근 권한을 설정하고, 불필요하게 넓은 접근 권한(예: 0.0.0.0/0)을 제한하세요.\n"
-        analysis += "* **인프라 코드 리뷰 프로세스를 강화**하여 배포 전 보안 취약점을 미리 발견하고 수정할 수 있도록 합니다.\n\n"
+        yield "**권장사항:**\n"
+        yield "* **Terraform 설정에서 보안 모범 사례를 적극적으로 적용**하세요.\n"
+        yield "* **민감한 정보가 하드코딩되지 않도록 확인**하고, AWS Secrets Manager 등 안전한 서비스로 관리하세요.\n"
+        yield "* **최소 권한 원칙**에 따라 리소스 접근 권한을 설정하고, 불필요하게 넓은 접근 권한(예: 0.0.0.0/0)을 제한하세요.\n"
+        yield "* **인프라 코드 리뷰 프로세스를 강화**하여 배포 전 보안 취약점을 미리 발견하고 수정할 수 있도록 합니다.\n\n"
     
     # 일반적인 보안 권장사항
-    analysis += "### 🛡️ 일반 보안 권장사항\n\n"
+    yield "### 🛡️ 일반 보안 권장사항\n\n"
     if high_count > 0:
-        analysis += f"1. **즉시 조치**: 발견된 **높은 심각도 취약점(총 {high_count}개)**을 우선적으로 해결해야 합니다.\n"
+        yield f"1. **즉시 조치**: 발견된 **높은 심각도 취약점(총 {high_count}개)**을 우선적으로 해결해야 합니다.\n"
     if medium_count > 0:
-        analysis += f"2. **계획적 조치**: 중간 심각도 취약점에 대한 해결 계획을 수립하고 순차적으로 조치하세요.\n"
-    analysis += "3. **정기 모니터링**: 자동화된 보안 스캔을 CI/CD 파이프라인에 통합하여 지속적으로 보안 상태를 모니터링하세요.\n"
-    analysis += "4. **팀 교육**: 보안 모범 사례 및 최신 위협 동향에 대해 팀원들을 교육하여 보안 인식을 높이세요.\n"
-    analysis += "5. **문서화**: 조직의 보안 정책 및 절차를 명확히 문서화하여 일관된 보안 관리를 유지하세요.\n\n"
+        yield f"2. **계획적 조치**: 중간 심각도 취약점에 대한 해결 계획을 수립하고 순차적으로 조치하세요.\n"
+    yield "3. **정기 모니터링**: 자동화된 보안 스캔을 CI/CD 파이프라인에 통합하여 지속적으로 보안 상태를 모니터링하세요.\n"
+    yield "4. **팀 교육**: 보안 모범 사례 및 최신 위협 동향에 대해 팀원들을 교육하여 보안 인식을 높이세요.\n"
+    yield "5. **문서화**: 조직의 보안 정책 및 절차를 명확히 문서화하여 일관된 보안 관리를 유지하세요.\n\n"
+
+# 지원하는 출력 형식과 기본 파일 이름
+OUTPUT_FORMATS = {
+    "md": "trivy-security-report.md",
+    "json": "trivy-security-report.json",
+    "jsonl": "trivy-findings.jsonl",
+    "html": "trivy-security-report.html"
+}
+
+# 모든 취약점을 순회해야 하는 출력 형식 (스트리밍 모드에서는 사용할 수 없음)
+FINDING_OUTPUT_FORMATS = ("jsonl", "html")
+
+# JSON 요약에 포함되는 파일/rule별 상위 항목 수
+SUMMARY_TOP_LIMIT = 10
+
+
+def build_summary(scans: Dict[str, Dict], baseline_diff: Optional[BaselineDiff] = None) -> Dict:
+    """대시보드용 JSON 요약을 만듭니다. 인덱스의 카운트만 사용하므로 취약점을 다시 순회하지 않습니다."""
+    totals = dict.fromkeys(("total",) + SEVERITY_LEVELS, 0)
+    summary_scans = {}
+    for category, scan in scans.items():
+        if "error" in scan:
+            summary_scans[category] = {"status": "error", "error": scan["error"]}
+            continue
+        index = scan["index"]
+        distribution = index.severity_distribution()
+        totals["total"] += len(index)
+        for severity, count in distribution.items():
+            totals[severity] += count
+        summary_scans[category] = {
+            "status": "ok",
+            "total": len(index),
+            "severity_distribution": distribution,
+            "top_files": [{"location": location, "count": count} for location, count in
+                          heapq.nlargest(SUMMARY_TOP_LIMIT, index.file_counts.items(), key=lambda item: item[1])],
+            "top_rules": [{"rule_id": rule_id, "count": count} for rule_id, count in
+                          heapq.nlargest(SUMMARY_TOP_LIMIT, index.rule_counts.items(), key=lambda item: item[1])],
+            "sources": [{"path": path, "error": outcome} if isinstance(outcome, str) else {"path": path, "total": outcome}
+                        for path, outcome in scan.get("sources", [])]
+        }
     
-    return analysis
+    summary = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "repository": os.environ.get('GITHUB_REPOSITORY'),
+        "ref": os.environ.get('GITHUB_REF'),
+        "commit": os.environ.get('GITHUB_SHA'),
+        "status": "passed" if totals["error"] == 0 else "failed",
+        "totals": totals,
+        "scans": summary_scans
+    }
+    if baseline_diff is not None:
+        summary["baseline"] = {
+            "new": baseline_diff.new_count,
+            "fixed": baseline_diff.fixed_count,
+            "unchanged": baseline_diff.unchanged,
+            "skipped": baseline_diff.skipped,
+            "skip_reasons": baseline_diff.skip_reasons
+        }
+    return summary
+
+
+_HTML_STYLE = """body{font-family:sans-serif;margin:2em}table{border-collapse:collapse;width:100%}
+th,td{border:1px solid #ccc;padding:4px 8px;text-align:left;vertical-align:top}th{background:#f4f4f4}
+td pre{margin:0;white-space:pre-wrap}.error{color:#b00020}.warning{color:#b26a00}.note{color:#2e6da4}"""
+
+
+def _html_header(summary: Dict) -> str:
+    """HTML 보고서의 머리말(요약 표)과 취약점 표 시작 부분을 만듭니다."""
+    totals = summary["totals"]
+    rows = []
+    for category, scan in summary["scans"].items():
+        label = escape(SCAN_CATEGORY_LABELS.get(category, category))
+        if scan["status"] == "error":
+            rows.append(f"<tr><td>{label}</td><td colspan='4'>❌ {escape(scan['error'])}</td></tr>")
+            continue
+        distribution = scan["severity_distribution"]
+        rows.append(f"<tr><td>{label}</td><td>{scan['total']}</td><td>{distribution['error']}</td>"
+                    f"<td>{distribution['warning']}</td><td>{distribution['note']}</td></tr>")
+    status = "✅ 통과" if summary["status"] == "passed" else "❌ 실패"
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head><meta charset="utf-8"><title>AI 보안 스캔 보고서</title><style>{_HTML_STYLE}</style></head>
+<body>
+<h1>🤖 AI 보안 스캔 보고서</h1>
+<p>스캔 날짜: {escape(summary['generated_at'])} · 최종 보안 상태: <b>{status}</b></p>
+<h2>📊 전체 통계</h2>
+<p>총 취약점 {totals['total']}개 (높음 {totals['error']}, 중간 {totals['warning']}, 낮음 {totals['note']})</p>
+<table><tr><th>스캔</th><th>총계</th><th>높음</th><th>중간</th><th>낮음</th></tr>
+{''.join(rows)}
+</table>
+<h2>🔍 취약점 목록</h2>
+<table><tr><th>스캔</th><th>심각도</th><th>Rule</th><th>위치</th><th>설명</th></tr>
+"""
+
+
+def _html_row(category: str, finding: Finding) -> str:
+    return (f"<tr><td>{escape(SCAN_CATEGORY_LABELS.get(category, category))}</td>"
+            f"<td class='{finding.severity}'>{SEVERITY_LABELS[finding.severity]}</td>"
+            f"<td>{escape(finding.rule_id)}</td><td>{escape(finding.location)}</td>"
+            f"<td><pre>{escape(finding.message)}</pre></td></tr>\n")
+
+
+_HTML_FOOTER = "</table>\n</body>\n</html>\n"
 
-def main():
+
+def render_outputs(scans: Dict[str, Dict], outputs: List[Tuple[str, str]],
+                   baseline_diff: Optional[BaselineDiff] = None) -> int:
+    """요청된 (형식, 경로) 목록에 따라 보고서를 씁니다.
+
+    md/json은 인덱스 조회만으로 만들고, 취약점 단위 출력(jsonl, html)은 모든 출력 파일을 함께 열어
+    취약점 목록을 한 번만 순회하면서 각 파일에 행을 씁니다. 순회한 취약점 수를 반환합니다.
+    """
+    summary = None
+    finding_sinks = []
+    try:
+        for fmt, path in outputs:
+            f = open(path, 'w', encoding='utf-8', buffering=REPORT_WRITE_BUFFER)
+            if fmt == "md":
+                with f:
+                    write_ai_report(f, scans.get("fs", {}), scans.get("iac", {}), baseline_diff)
+            elif fmt == "json":
+                summary = summary or build_summary(scans, baseline_diff)
+                with f:
+                    json.dump(summary, f, ensure_ascii=False, indent=2)
+            elif fmt == "jsonl":
+                finding_sinks.append((f, _finding_record))
+            elif fmt == "html":
+                summary = summary or build_summary(scans, baseline_diff)
+                f.write(_html_header(summary))
+                finding_sinks.append((f, _html_row))
+            else:
+                f.close()
+                raise ValueError(f"지원하지 않는 출력 형식: {fmt}")
+        
+        count = 0
+        if finding_sinks:
+            for category, scan in scans.items():
+                if "error" in scan:
+                    continue
+                for finding in scan["all_vulnerabilities"]:
+                    for f, render in finding_sinks:
+                        f.write(render(category, finding))
+                    count += 1
+        for f, render in finding_sinks:
+            if render is _html_row:
+                f.write(_HTML_FOOTER)
+        return count
+    finally:
+        for f, _ in finding_sinks:
+            f.close()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """명령행 인자를 파싱합니다."""
+    parser = argparse.ArgumentParser(description="Trivy SARIF 결과로 AI 보안 보고서를 생성합니다.")
+    parser.add_argument("inputs", nargs="*",
+                        help="SARIF 파일, 디렉토리 또는 glob 패턴 (기본값: 스크립트 위치의 trivy-results.sarif, trivy-iac-results.sarif). "
+                             "파일 이름에 iac/config/terraform이 포함되면 IaC 스캔으로 분류됩니다")
+    parser.add_argument("--stream", action="store_true",
+                        help="SARIF 파일을 스트리밍으로 파싱하여 대용량 입력에서도 메모리 사용량을 일정하게 유지합니다")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="SARIF 파일을 병렬로 파싱할 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--gate", action="store_true",
+                        help="보고서를 만들지 않고 통과/실패만 판정합니다. 임계값을 넘는 즉시 파싱을 멈추고 종료 코드 1을 반환합니다")
+    parser.add_argument("--max-errors", type=int, default=0,
+                        help="--gate에서 허용하는 error(높은 심각도) 취약점 수 (기본값: 0)")
+    parser.add_argument("--max-warnings", type=int, default=None,
+                        help="--gate에서 허용하는 warning(중간 심각도) 취약점 수 (기본값: 제한 없음)")
+    parser.add_argument("--format", default="md",
+                        help=f"출력 형식 목록, 쉼표로 구분 ({', '.join(OUTPUT_FORMATS)}; 기본값: md)")
+    parser.add_argument("--output-dir", default=None,
+                        help="보고서를 저장할 디렉토리 (기본값: 스크립트 위치)")
+    parser.add_argument("--export-findings", metavar="PATH", default=None,
+                        help="모든 취약점을 fingerprint와 함께 JSONL로 내보냅니다 (다음 실행의 --baseline 입력)")
+    parser.add_argument("--baseline", metavar="PATH", default=None,
+                        help="이전 실행의 --export-findings 결과와 비교하여 신규/해결 취약점을 보고서 맨 앞에 표시합니다")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="파싱 결과 캐시를 사용하지 않고 모든 SARIF 파일을 다시 파싱합니다")
+    parser.add_argument("--cache-dir", default=None,
+                        help="파싱 결과 캐시 디렉토리 (기본값: 스크립트 위치의 .sarif-cache)")
+    parser.add_argument("--cache-max-mb", type=int, default=DEFAULT_CACHE_MAX_MB,
+                        help=f"캐시 최대 크기(MB), 초과 시 오래된 항목부터 삭제 (기본값: {DEFAULT_CACHE_MAX_MB})")
+    args = parser.parse_args(argv)
+    args.formats = list(dict.fromkeys(fmt.strip() for fmt in args.format.split(",") if fmt.strip()))
+    unknown = [fmt for fmt in args.formats if fmt not in OUTPUT_FORMATS]
+    if unknown or not args.formats:
+        parser.error(f"지원하지 않는 출력 형식: {', '.join(unknown) or args.format}")
+    if args.stream and (args.baseline or args.export_findings):
+        parser.error("--baseline/--export-findings는 모든 취약점이 필요하므로 --stream과 함께 사용할 수 없습니다")
+    if args.stream and any(fmt in FINDING_OUTPUT_FORMATS for fmt in args.formats):
+        parser.error(f"{'/'.join(FINDING_OUTPUT_FORMATS)} 출력은 모든 취약점이 필요하므로 --stream과 함께 사용할 수 없습니다")
+    return args
+
+def run_gate(sarif_files: List[str], max_errors: int, max_warnings: Optional[int]) -> int:
+    """게이트 판정 결과를 출력하고 종료 코드(0: 통과, 1: 실패, 2: 판정 불가)를 반환합니다."""
+    passed, details = evaluate_gate(sarif_files, max_errors, max_warnings)
+    counts = details["counts"]
+    summary = (f"높음 {counts['error']}개, 중간 {counts['warning']}개 "
+               f"(파일 {details['scanned_files']}/{len(sarif_files)}개, 결과 {details['scanned_results']}개 확인)")
+    if passed is None:
+        print(f"⚠️  보안 게이트 판정 불가: {details['error']}")
+        return 2
+    if not passed:
+        limits = f"허용: 높음 {max_errors}개" + (f", 중간 {max_warnings}개" if max_warnings is not None else "")
+        print(f"❌ 보안 게이트 실패: {summary} - {limits}, {details['stopped_at']}에서 중단")
+        return 1
+    print(f"✅ 보안 게이트 통과: {summary}")
+    return 0
+
+def main(argv: Optional[List[str]] = None):
     """보안 보고서 생성을 위한 메인 함수입니다."""
-    print("🔍 Trivy 보안 스캔 결과를 분석하고 AI 보고서를 생성합니다...")
+    args = parse_args(argv)
+    if args.gate:
+        print("🚦 Trivy 보안 스캔 결과로 보안 게이트를 판정합니다...")
+    else:
+        print("🔍 Trivy 보안 스캔 결과를 분석하고 AI 보고서를 생성합니다...")
     
     # 현재 스크립트 위치 기준으로 경로 설정
     script_dir = os.path.dirname(os.path.abspath(__file__))
     
-    # Trivy 스캔 결과 파싱 (devsecops-k8s 디렉토리에서 SARIF 파일 찾기)
-    trivy_fs_results = parse_sarif_file(os.path.join(script_dir, "trivy-results.sarif"))
-    trivy_iac_results = parse_sarif_file(os.path.join(script_dir, "trivy-iac-results.sarif"))
+    # Trivy 스캔 결과 파싱 (입력이 없으면 devsecops-k8s 디렉토리에서 SARIF 파일 찾기)
+    inputs = args.inputs or [os.path.join(script_dir, "trivy-results.sarif"),
+                             os.path.join(script_dir, "trivy-iac-results.sarif")]
+    sarif_files = expand_sarif_inputs(inputs)
+    
+    # 게이트 모드: 판정만 하고 보고서 생성은 건너뜀
+    if args.gate:
+        sys.exit(run_gate(sarif_files, args.max_errors, args.max_warnings))
+    
+    cache = None
+    if not args.no_cache:
+        cache = SarifCache(args.cache_dir or os.path.join(script_dir, ".sarif-cache"),
+                           max_bytes=args.cache_max_mb * 1024 * 1024)
+    parsed = parse_sarif_files(sarif_files, streaming=args.stream, jobs=args.jobs, cache=cache)
+    if cache is not None:
+        evicted = cache.evict()
+        print(f"💾 SARIF 캐시: 적중 {cache.hits}개, 미스 {cache.misses}개" + (f", 정리 {evicted}개" if evicted else ""))
+    
+    # 스캔 카테고리별로 파일 결과 합치기
+    grouped = {category: [] for category in SCAN_CATEGORIES}
+    for path, result in parsed:
+        grouped[scan_category(path)].append((path, result))
+    trivy_fs_results = merge_scan_results(grouped["fs"])
+    trivy_iac_results = merge_scan_results(grouped["iac"])
+    scans = {"fs": trivy_fs_results, "iac": trivy_iac_results}
     
-    # AI 기반 보고서 생성
-    report_content = generate_ai_report(trivy_fs_results, trivy_iac_results)
+    # 베이스라인 비교
+    baseline_diff = None
+    if args.baseline:
+        baseline_diff = diff_against_baseline(scans, load_baseline(args.baseline))
+        print(f"🔄 베이스라인 비교: 신규 {baseline_diff.new_count}개, 해결 {baseline_diff.fixed_count}개, "
+              f"변경 없음 {baseline_diff.unchanged}개")
+        for category in baseline_diff.skipped:
+            print(f"⚠️  베이스라인 비교 제외: {SCAN_CATEGORY_LABELS.get(category, category)} "
+                  f"({baseline_diff.skip_reasons[category]})")
     
-    # 보고서 파일에 저장 (스크립트와 같은 디렉토리에 저장)
-    output_file = os.path.join(script_dir, "trivy-security-report.md")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(report_content)
+    # 요청된 형식의 보고서를 생성하면서 파일에 바로 저장 (기본: 스크립트와 같은 디렉토리)
+    output_dir = args.output_dir or script_dir
+    os.makedirs(output_dir, exist_ok=True)
+    outputs = [(fmt, os.path.join(output_dir, OUTPUT_FORMATS[fmt])) for fmt in args.formats]
+    if args.export_findings:
+        outputs.append(("jsonl", args.export_findings))
+    render_outputs(scans, outputs, baseline_diff)
+    if args.export_findings:
+        print(f"📤 취약점 목록을 내보냈습니다: {args.export_findings}")
     
     # 통계 출력
     total_vulns = 0
@@ -310,7 +1429,9 @@ def main():
     if "error" not in trivy_iac_results:
         total_vulns += trivy_iac_results.get("total_vulnerabilities", 0)
     
-    print(f"✅ AI 보안 보고서 생성 완료: {output_file}")
+    for fmt, path in outputs:
+        if path != args.export_findings:
+            print(f"✅ AI 보안 보고서 생성 완료: {path}")
     print(f"📊 발견된 총 취약점: {total_vulns}개")
     
     if total_vulns == 0:
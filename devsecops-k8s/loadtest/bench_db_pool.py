@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+DB Connection Pool Benchmark
+MySQL stand-in 서버(fake_mysql.py)를 대상으로 Flask 앱의 DB 경로(save_to_db, /logs, /logs/<id>)를
+요청마다 연결하는 방식(DB_POOL_SIZE=0)과 커넥션 풀 방식으로 각각 실행하여 초당 요청 수를 비교합니다.
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+from fake_mysql import FakeMySQLServer
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ansible", "roles", "flask", "files")
+
+
+def _load_app(port: int):
+    os.environ.update({"RDS_HOST": "127.0.0.1", "RDS_PORT": str(port), "RDS_USER": "bench",
+                       "RDS_PASSWORD": "bench", "RDS_DATABASE": "saju",
+                       # /logs, /logs/<id> 읽기 캐시를 끄고 매 요청이 DB까지 가도록 함 (연결 비용 비교가 목적)
+                       "LOGS_CACHE_SIZE": "0", "LOGS_CACHE_TTL": "0"})
+    sys.path.insert(0, os.path.abspath(APP_DIR))
+    import app
+    return app
+
+
+def _request(app_module, client, i: int):
+    kind = i % 3
+    if kind == 0:
+        app_module.save_to_db(f"bench-{i}", "양력 1990-01-01", "12", "벤치마크 결과")
+        return 200
+    if kind == 1:
+        return client.get("/logs").status_code
+    return client.get(f"/logs/{i}").status_code
+
+
+def run(app_module, pool_size: int, requests_total: int, concurrency: int) -> Dict:
+    """pool_size로 풀을 교체한 뒤 concurrency개 스레드로 requests_total개 요청을 보냅니다."""
+    app_module.db_pool = app_module.ConnectionPool(pool_size)
+    client = app_module.app.test_client()
+    counter = iter(range(requests_total))
+    lock = threading.Lock()
+    errors = []
+
+    def worker():
+        while True:
+            with lock:
+                i = next(counter, None)
+            if i is None:
+                return
+            try:
+                if _request(app_module, client, i) != 200:
+                    errors.append(i)
+            except Exception as e:
+                errors.append(e)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    return {"pool_size": pool_size, "requests": requests_total, "seconds": round(elapsed, 4),
+            "req_per_sec": round(requests_total / elapsed, 1), "errors": len(errors)}
+
+
+def main(argv: Optional[List[str]] = None):
+    """벤치마크 실행을 위한 메인 함수입니다."""
+    parser = argparse.ArgumentParser(description="요청마다 연결 vs 커넥션 풀의 초당 요청 수를 비교합니다.")
+    parser.add_argument("--requests", type=int, default=600, help="모드별 요청 수 (기본값: 600)")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 요청 스레드 수 (기본값: 8)")
+    parser.add_argument("--pool-size", type=int, default=5, help="커넥션 풀 크기 (기본값: 5)")
+    parser.add_argument("--connect-latency", type=float, default=0.02,
+                        help="stand-in 서버의 연결 지연 시간, 초 (기본값: 0.02, RDS TCP+인증 왕복 흉내)")
+    parser.add_argument("--query-latency", type=float, default=0.001, help="쿼리 지연 시간, 초 (기본값: 0.001)")
+    args = parser.parse_args(argv)
+
+    server = FakeMySQLServer(connect_latency=args.connect_latency, query_latency=args.query_latency).start()
+    try:
+        app_module = _load_app(server.port)
+        results = []
+        for pool_size in (0, args.pool_size):
+            before = server.connections
+            result = run(app_module, pool_size, args.requests, args.concurrency)
+            result["connections"] = server.connections - before
+            results.append(result)
+            label = "요청마다 연결" if pool_size == 0 else f"커넥션 풀({pool_size})"
+            print(f"⏱️  {label:<12} {result['req_per_sec']:>8.1f} req/s  "
+                  f"{result['seconds']:>7.2f}s  연결 {result['connections']}회  오류 {result['errors']}건")
+        print(f"📈 풀 사용 시 처리량 x{results[1]['req_per_sec'] / results[0]['req_per_sec']:.2f}")
+    finally:
+        server.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Fake Gemini Server
+Gemini generateContent / streamGenerateContent(alt=sse) API를 흉내내는 로컬 HTTP 서버입니다.
+앱의 GEMINI_API_BASE를 이 서버로 지정하면 실제 API 키와 쿼터 없이 지연 시간, 오류율(429/5xx),
+Retry-After 동작을 재현할 수 있습니다.
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+_GENERATE_PATH = re.compile(r"^/v1(?:beta)?/models/(?P<model>[^/:]+):(?P<method>generateContent|streamGenerateContent)"
+                            r"(?:\?|$)")
+STREAM_CHUNK_CHARS = 40
+
+SAMPLE_FORTUNE = ("타고난 기운은 나무(木)가 강하고 물(水)이 이를 돕는 형국입니다. "
+                  "성품이 곧고 인정이 많으며, 중년 이후 재물운이 점차 트입니다. ")
+
+
+class _FakeGeminiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 재사용 여부를 확인할 수 있도록 HTTP/1.1 사용
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status: int, document: dict, headers: Optional[dict] = None):
+        payload = json.dumps(document, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _prompt(self) -> str:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        return body["contents"][0]["parts"][0]["text"]
+
+    def do_POST(self):
+        server = self.server
+        match = _GENERATE_PATH.match(self.path)
+        if not match:
+            self._reply(404, {"error": {"code": 404, "message": "not found", "status": "NOT_FOUND"}})
+            return
+        try:
+            prompt = self._prompt()
+        except (ValueError, KeyError, IndexError, TypeError):
+            self._reply(400, {"error": {"code": 400, "message": "invalid request", "status": "INVALID_ARGUMENT"}})
+            return
+
+        with server.lock:
+            server.requests += 1
+            failing = server.fail_next > 0 or server.rng.random() < server.error_rate
+            if server.fail_next > 0:
+                server.fail_next -= 1
+            delay = max(0.0, server.rng.gauss(server.latency, server.latency_jitter)) if server.latency else 0.0
+        streaming = match.group("method") == "streamGenerateContent"
+        # 스트리밍 성공 응답은 지연 시간을 조각 사이에 나눠서 보냄
+        if delay and (failing or not streaming):
+            time.sleep(delay)
+
+        if failing:
+            with server.lock:
+                server.errors += 1
+            headers = {"Retry-After": str(server.retry_after)} if server.retry_after is not None else None
+            self._reply(server.error_status, {"error": {"code": server.error_status, "message": "fake error",
+                                                        "status": "RESOURCE_EXHAUSTED"}}, headers)
+            return
+        if streaming:
+            self._stream(server.answer(prompt), delay, match.group("model"))
+            return
+        self._reply(200, {
+            "candidates": [{"content": {"role": "model", "parts": [{"text": server.answer(prompt)}]},
+                            "finishReason": "STOP"}],
+            "modelVersion": match.group("model")
+        })
+
+    def _stream(self, text: str, total_delay: float, model: str):
+        """답변을 조각으로 나눠 SSE로 보냅니다. 전체 지연 시간은 조각 사이에 고르게 나눕니다."""
+        chunks = [text[i:i + STREAM_CHUNK_CHARS] for i in range(0, len(text), STREAM_CHUNK_CHARS)]
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for index, chunk in enumerate(chunks):
+            if total_delay:
+                time.sleep(total_delay / len(chunks))
+            candidate = {"content": {"role": "model", "parts": [{"text": chunk}]}}
+            if index == len(chunks) - 1:
+                candidate["finishReason"] = "STOP"
+            event = json.dumps({"candidates": [candidate], "modelVersion": model}, ensure_ascii=False)
+            payload = f"data: {event}\r\n\r\n".encode("utf-8")
+            self.wfile.write(f"{len(payload):x}\r\n".encode() + payload + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+
+class FakeGeminiServer(ThreadingHTTPServer):
+    """가짜 Gemini 서버. port=0이면 빈 포트를 사용하며 start() 후 self.base_url로 접속합니다.
+
+    error_rate 비율(또는 fail_next개)의 요청은 error_status로 실패하고, retry_after가 있으면 헤더로 보냅니다.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, latency_jitter: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 429, retry_after: Optional[int] = None,
+                 answer_repeat: int = 20, seed: Optional[int] = None):
+        super().__init__((host, port), _FakeGeminiHandler)
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.answer_repeat = answer_repeat
+        self.fail_next = 0
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self._thread = None
+
+    def answer(self, prompt: str) -> str:
+        return f"{prompt}\n\n" + SAMPLE_FORTUNE * self.answer_repeat
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeGeminiServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def main(argv: Optional[List[str]] = None):
+    """가짜 Gemini 서버를 단독으로 실행합니다."""
+    parser = argparse.ArgumentParser(description="로컬 가짜 Gemini API 서버를 실행합니다.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=1.0, help="평균 응답 지연 시간, 초 (기본값: 1.0)")
+    parser.add_argument("--latency-jitter", type=float, default=0.2, help="지연 시간 표준편차, 초 (기본값: 0.2)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="실패 응답 비율 0~1 (기본값: 0)")
+    parser.add_argument("--error-status", type=int, default=429, help="실패 응답 상태 코드 (기본값: 429)")
+    parser.add_argument("--retry-after", type=int, default=None, help="실패 응답에 붙일 Retry-After(초)")
+    args = parser.parse_args(argv)
+
+    server = FakeGeminiServer(args.host, args.port, args.latency, args.latency_jitter, args.error_rate,
+                              args.error_status, args.retry_after)
+    print(f"🤖 가짜 Gemini 서버 실행: {server.base_url} (GEMINI_API_BASE={server.base_url})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
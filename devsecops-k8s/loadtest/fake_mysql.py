@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+MySQL Stand-in Server
+벤치마크/부하 테스트용으로 MySQL 클라이언트 프로토콜의 최소한만 구현한 가짜 서버입니다.
+
+핸드셰이크(모든 인증 허용), COM_QUERY, COM_PING, COM_INIT_DB, COM_QUIT를 처리합니다.
+데이터는 저장하지 않으며, SELECT에는 컬럼 이름에 맞춘 합성 행을, 그 외 쿼리에는 OK 패킷을 돌려줍니다.
+연결/쿼리 지연 시간을 설정하여 RDS까지의 네트워크·인증 비용을 흉내낼 수 있습니다.
+"""
+
+import argparse
+import re
+import socketserver
+import struct
+import threading
+import time
+from typing import List, Optional
+
+SERVER_VERSION = b"8.0.36-standin"
+DEFAULT_ROW_COUNT = 10
+
+# CLIENT_LONG_PASSWORD | FOUND_ROWS | LONG_FLAG | CONNECT_WITH_DB | PROTOCOL_41 | TRANSACTIONS
+# | SECURE_CONNECTION | MULTI_STATEMENTS | MULTI_RESULTS | PLUGIN_AUTH
+CAPABILITIES = 0x1 | 0x2 | 0x4 | 0x8 | 0x200 | 0x2000 | 0x8000 | 0x10000 | 0x20000 | 0x80000
+STATUS_AUTOCOMMIT = 0x0002
+
+COM_QUIT = 0x01
+COM_INIT_DB = 0x02
+COM_QUERY = 0x03
+COM_PING = 0x0e
+
+TYPE_LONGLONG = 0x08
+TYPE_DATETIME = 0x0c
+TYPE_VAR_STRING = 0xfd
+CHARSET_UTF8MB4 = 45
+CHARSET_BINARY = 63
+
+SAMPLE_RESULT = "갑자년 을축월 병인일 정묘시에 태어난 사주입니다. " * 40
+
+_SELECT_COLUMNS = re.compile(r"^\s*SELECT\s+(.*?)\s+FROM\s", re.IGNORECASE | re.DOTALL)
+_LIMIT = re.compile(r"\bLIMIT\s+(\d+)", re.IGNORECASE)
+_BY_ID = re.compile(r"\bWHERE\s+id\s*=", re.IGNORECASE)
+
+
+def _lenenc_int(value: int) -> bytes:
+    if value < 251:
+        return bytes((value,))
+    if value < 1 << 16:
+        return b"\xfc" + struct.pack("<H", value)
+    if value < 1 << 24:
+        return b"\xfd" + struct.pack("<I", value)[:3]
+    return b"\xfe" + struct.pack("<Q", value)
+
+
+def _lenenc_str(value: bytes) -> bytes:
+    return _lenenc_int(len(value)) + value
+
+
+def _split_columns(expression: str) -> List[str]:
+    """SELECT 절을 최상위 쉼표 기준으로 나누고 각 컬럼의 이름(별칭)을 반환합니다."""
+    names, depth, current = [], 0, []
+    for ch in expression + ",":
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        if ch == "," and depth == 0:
+            column = "".join(current).strip()
+            names.append(re.split(r"\s+|\.", column)[-1].strip("`") or "col")
+            current = []
+        else:
+            current.append(ch)
+    return names
+
+
+def _column_type(name: str) -> int:
+    lowered = name.lower()
+    if lowered == "id" or lowered.endswith("_id") or "count" in lowered or lowered == "total":
+        return TYPE_LONGLONG
+    if lowered.endswith("_at"):
+        return TYPE_DATETIME
+    return TYPE_VAR_STRING
+
+
+def _column_value(name: str, column_type: int, row: int) -> bytes:
+    if column_type == TYPE_LONGLONG:
+        return str(1000 - row).encode()
+    if column_type == TYPE_DATETIME:
+        return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(1700000000 - row * 60)).encode()
+    if name.lower() == "result":
+        return SAMPLE_RESULT.encode()
+    return f"{name}-{row}".encode()
+
+
+class _StandInHandler(socketserver.BaseRequestHandler):
+    def setup(self):
+        self.seq = 0
+
+    def _send(self, payload: bytes):
+        self.request.sendall(struct.pack("<I", len(payload))[:3] + bytes((self.seq,)) + payload)
+        self.seq = (self.seq + 1) & 0xff
+
+    def _recv_exact(self, size: int) -> Optional[bytes]:
+        data = b""
+        while len(data) < size:
+            chunk = self.request.recv(size - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
+    def _recv(self) -> Optional[bytes]:
+        header = self._recv_exact(4)
+        if header is None:
+            return None
+        length = header[0] | header[1] << 8 | header[2] << 16
+        self.seq = (header[3] + 1) & 0xff
+        return self._recv_exact(length)
+
+    def _ok(self, affected_rows: int = 0, insert_id: int = 0):
+        self._send(b"\x00" + _lenenc_int(affected_rows) + _lenenc_int(insert_id)
+                   + struct.pack("<HH", STATUS_AUTOCOMMIT, 0))
+
+    def _eof(self):
+        self._send(b"\xfe" + struct.pack("<HH", 0, STATUS_AUTOCOMMIT))
+
+    def _handshake(self) -> bool:
+        server = self.server
+        if server.connect_latency:
+            time.sleep(server.connect_latency)
+        with server.lock:
+            server.connections += 1
+            connection_id = server.connections
+        salt = b"standin-salt-0123456"
+        self._send(b"\x0a" + SERVER_VERSION + b"\x00" + struct.pack("<I", connection_id) + salt[:8] + b"\x00"
+                   + struct.pack("<H", CAPABILITIES & 0xffff) + bytes((CHARSET_UTF8MB4,))
+                   + struct.pack("<HH", STATUS_AUTOCOMMIT, CAPABILITIES >> 16) + bytes((len(salt) + 1,))
+                   + b"\x00" * 10 + salt[8:] + b"\x00" + b"mysql_native_password\x00")
+        if self._recv() is None:
+            return False
+        self._ok()
+        return True
+
+    def _result_set(self, sql: str):
+        columns = _split_columns(_SELECT_COLUMNS.match(sql).group(1))
+        types = [_column_type(name) for name in columns]
+        if _BY_ID.search(sql):
+            rows = 1
+        else:
+            limit = _LIMIT.search(sql)
+            rows = min(int(limit.group(1)), self.server.row_count) if limit else self.server.row_count
+
+        self._send(_lenenc_int(len(columns)))
+        for name, column_type in zip(columns, types):
+            charset = CHARSET_UTF8MB4 if column_type == TYPE_VAR_STRING else CHARSET_BINARY
+            self._send(_lenenc_str(b"def") + _lenenc_str(b"saju") + _lenenc_str(b"logs") + _lenenc_str(b"logs")
+                       + _lenenc_str(name.encode()) + _lenenc_str(name.encode())
+                       + b"\x0c" + struct.pack("<HIBHB", charset, 65535, column_type, 0, 0) + b"\x00\x00")
+        self._eof()
+        for row in range(rows):
+            self._send(b"".join(_lenenc_str(_column_value(name, column_type, row))
+                                for name, column_type in zip(columns, types)))
+        self._eof()
+
+    def handle(self):
+        if not self._handshake():
+            return
+        server = self.server
+        while True:
+            packet = self._recv()
+            if not packet or packet[0] == COM_QUIT:
+                return
+            self.seq = 1
+            command = packet[0]
+            if command == COM_QUERY:
+                sql = packet[1:].decode("utf-8", "replace")
+                with server.lock:
+                    server.queries += 1
+                if server.query_latency:
+                    time.sleep(server.query_latency)
+                if _SELECT_COLUMNS.match(sql):
+                    self._result_set(sql)
+                elif sql.lstrip()[:6].upper() == "INSERT":
+                    # executemany는 여러 행을 한 번에 넣으므로 VALUES 튜플 개수를 영향받은 행 수로 사용
+                    rows = max(1, len(re.findall(r"\)\s*,\s*\(", sql)) + 1)
+                    with server.lock:
+                        server.last_insert_id += rows
+                        insert_id = server.last_insert_id - rows + 1
+                    self._ok(rows, insert_id)
+                else:
+                    self._ok()
+            elif command in (COM_PING, COM_INIT_DB):
+                self._ok()
+            else:
+                self._send(b"\xff" + struct.pack("<H", 1047) + b"#08S01Unknown command")
+
+
+class FakeMySQLServer(socketserver.ThreadingTCPServer):
+    """스레드 기반 MySQL stand-in 서버. port=0이면 빈 포트를 사용하며 start() 후 self.port로 확인합니다."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, connect_latency: float = 0.0,
+                 query_latency: float = 0.0, row_count: int = DEFAULT_ROW_COUNT):
+        super().__init__((host, port), _StandInHandler)
+        self.connect_latency = connect_latency
+        self.query_latency = query_latency
+        self.row_count = row_count
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.queries = 0
+        self.last_insert_id = 0
+        self._thread = None
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def start(self) -> "FakeMySQLServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def main(argv: Optional[List[str]] = None):
+    """stand-in 서버를 단독으로 실행합니다."""
+    parser = argparse.ArgumentParser(description="벤치마크용 MySQL stand-in 서버를 실행합니다.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3307)
+    parser.add_argument("--connect-latency", type=float, default=0.02, help="연결(핸드셰이크) 지연 시간, 초 (기본값: 0.02)")
+    parser.add_argument("--query-latency", type=float, default=0.001, help="쿼리 지연 시간, 초 (기본값: 0.001)")
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROW_COUNT, help="SELECT 결과 행 수 상한")
+    args = parser.parse_args(argv)
+
+    server = FakeMySQLServer(args.host, args.port, args.connect_latency, args.query_latency, args.rows)
+    print(f"🐬 MySQL stand-in 서버 실행: {args.host}:{server.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
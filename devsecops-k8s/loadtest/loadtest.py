@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Saju App Load Test
+가짜 Gemini 서버(fake_gemini.py)와 MySQL stand-in(fake_mysql.py)을 띄우고 Flask 앱을 지정한 서빙 모드로 실행한 뒤,
+정해진 동시성으로 POST / 와 GET /logs 요청을 보내 처리량과 p50/p95/p99 지연 시간을 측정합니다.
+
+결과는 JSON으로 저장되어 배포 전 서빙 모드 간 비교나 이전 결과와의 비교(--compare)에 사용할 수 있습니다.
+외부 API나 RDS 없이 오프라인으로 동작합니다.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import requests
+
+LOADTEST_DIR = os.path.dirname(os.path.abspath(__file__))
+METRICS_DIR = os.path.join(LOADTEST_DIR, ".loadtest-metrics")
+APP_DIR = os.path.normpath(os.path.join(LOADTEST_DIR, "..", "ansible", "roles", "flask", "files"))
+SERVE_MODES = ("flask", "gunicorn")
+DEFAULT_MIX = "post=1,logs=3"
+OPERATIONS = ("post", "logs")
+NAMES = ("홍길동", "김철수", "이영희", "박민수", "최지우", "정하늘", "강바다", "윤서연")
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _serve_fakes(mysql_port: int, gemini_port: int, options: Dict):
+    """별도 프로세스에서 가짜 서버 두 개를 실행합니다 (부하 발생기와 GIL을 나눠 쓰지 않도록)."""
+    sys.path.insert(0, LOADTEST_DIR)
+    from fake_gemini import FakeGeminiServer
+    from fake_mysql import FakeMySQLServer
+
+    FakeMySQLServer(port=mysql_port, connect_latency=options["db_connect_latency"],
+                    query_latency=options["db_query_latency"]).start()
+    gemini = FakeGeminiServer(port=gemini_port, latency=options["gemini_latency"],
+                              latency_jitter=options["gemini_jitter"], error_rate=options["gemini_error_rate"],
+                              error_status=options["gemini_error_status"], retry_after=options["gemini_retry_after"],
+                              seed=options["seed"])
+    gemini.serve_forever()
+
+
+def start_app(mode: str, port: int, mysql_port: int, gemini_port: int, workers: Optional[int],
+              threads: Optional[int], app_env: Dict[str, str]) -> subprocess.Popen:
+    """앱을 서빙 모드(flask 개발 서버 / gunicorn)로 실행합니다. 앱 로그는 loadtest-app-<모드>.log에 남깁니다."""
+    env = dict(os.environ)
+    env.update({
+        "RDS_HOST": "127.0.0.1", "RDS_PORT": str(mysql_port), "RDS_USER": "loadtest", "RDS_PASSWORD": "loadtest",
+        "GEMINI_API_BASE": f"http://127.0.0.1:{gemini_port}",
+        # stand-in DB는 어떤 SELECT에도 행을 돌려주므로 DB 캐시 계층을 켜면 Gemini 호출이 일어나지 않음
+        "FORTUNE_CACHE_DB": "0",
+        "GUNICORN_BIND": f"127.0.0.1:{port}",
+        "PROMETHEUS_MULTIPROC_DIR": os.path.join(METRICS_DIR, str(port)),
+    })
+    if workers:
+        env["GUNICORN_WORKERS"] = str(workers)
+    if threads:
+        env["GUNICORN_THREADS"] = str(threads)
+    env.update(app_env)
+    if mode == "flask":
+        env.pop("PROMETHEUS_MULTIPROC_DIR")
+        command = [sys.executable, "-c", f"import app; app.app.run(host='127.0.0.1', port={port}, threaded=True)"]
+    else:
+        os.makedirs(env["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+        command = [sys.executable, "-m", "gunicorn", "--config", "gunicorn.conf.py", "app:app"]
+    with open(os.path.join(LOADTEST_DIR, f"loadtest-app-{mode}.log"), 'w', encoding='utf-8') as log:
+        return subprocess.Popen(command, cwd=APP_DIR, env=env, stdout=log, stderr=subprocess.STDOUT)
+
+
+def wait_ready(base_url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(f"{base_url}/logs", timeout=2).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"앱이 {timeout:.0f}초 안에 응답하지 않습니다: {base_url}")
+
+
+def parse_mix(mix: str) -> Dict[str, int]:
+    weights = {}
+    for item in mix.split(","):
+        op, _, weight = item.partition("=")
+        if op.strip() not in OPERATIONS:
+            raise ValueError(f"알 수 없는 요청 종류: {op} (사용 가능: {', '.join(OPERATIONS)})")
+        weights[op.strip()] = int(weight or 1)
+    return weights
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """nearest-rank 백분위수."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def run_load(base_url: str, concurrency: int, duration: float, mix: Dict[str, int], unique_ratio: float,
+             seed: int, timeout: float) -> Dict:
+    """concurrency개 스레드가 duration초 동안 요청을 보내고 종류별 지연 시간을 모읍니다 (closed-loop)."""
+    ops = list(mix)
+    weights = [mix[op] for op in ops]
+    latencies = {op: [] for op in ops}
+    errors = {op: 0 for op in ops}
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + duration
+
+    def worker(index: int):
+        rng = random.Random(seed + index)
+        session = requests.Session()
+        local = {op: [] for op in ops}
+        local_errors = {op: 0 for op in ops}
+        while time.perf_counter() < stop_at:
+            op = rng.choices(ops, weights)[0]
+            start = time.perf_counter()
+            try:
+                if op == "post":
+                    name = f"부하-{uuid.uuid4().hex[:8]}" if rng.random() < unique_ratio else rng.choice(NAMES)
+                    res = session.post(f"{base_url}/", timeout=timeout, data={
+                        "name": name, "birth": f"19{rng.randrange(50, 99)}-0{rng.randrange(1, 9)}-1{rng.randrange(0, 9)}",
+                        "hour": str(rng.randrange(24)), "calendar": rng.choice(("양력", "음력"))})
+                    ok = res.status_code == 200 and "[오류 발생]" not in res.text
+                else:
+                    res = session.get(f"{base_url}/logs", timeout=timeout)
+                    ok = res.status_code == 200
+            except requests.RequestException:
+                ok = False
+            local[op].append(time.perf_counter() - start)
+            if not ok:
+                local_errors[op] += 1
+        with lock:
+            for op in ops:
+                latencies[op].extend(local[op])
+                errors[op] += local_errors[op]
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    summary = {}
+    for op in ops + ["all"]:
+        values = sorted(v for o in ops for v in latencies[o]) if op == "all" else sorted(latencies[op])
+        error_count = sum(errors.values()) if op == "all" else errors[op]
+        summary[op] = {
+            "requests": len(values),
+            "errors": error_count,
+            "throughput_rps": round(len(values) / elapsed, 2),
+            "p50_ms": round(percentile(values, 50) * 1000, 2),
+            "p95_ms": round(percentile(values, 95) * 1000, 2),
+            "p99_ms": round(percentile(values, 99) * 1000, 2),
+            "max_ms": round(values[-1] * 1000, 2) if values else 0.0
+        }
+    return {"seconds": round(elapsed, 3), "operations": summary}
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=LOADTEST_DIR, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_summary(label: str, result: Dict):
+    print(f"\n📊 {label} ({result['seconds']:.1f}s)")
+    for op, s in result["operations"].items():
+        print(f"  {op:<5} {s['requests']:>7}건  {s['throughput_rps']:>8.1f} req/s  "
+              f"p50 {s['p50_ms']:>8.1f}ms  p95 {s['p95_ms']:>8.1f}ms  p99 {s['p99_ms']:>8.1f}ms  오류 {s['errors']}")
+
+
+def compare_results(previous: Dict, current: Dict):
+    """이전 결과 파일과 실행(label)·요청 종류별로 비교합니다 (처리량 비율 > 1, 지연 비율 < 1이면 개선)."""
+    before = {run["label"]: run for run in previous.get("runs", [])}
+    print(f"\n📈 비교: {previous.get('commit')} → {current.get('commit')} (현재/이전 비율)")
+    for run in current["runs"]:
+        old = before.get(run["label"])
+        if old is None:
+            continue
+        for op, s in run["operations"].items():
+            o = old["operations"].get(op)
+            if not o or not o["throughput_rps"] or not o["p99_ms"]:
+                continue
+            print(f"  {run['label']:<14} {op:<5} 처리량 x{s['throughput_rps'] / o['throughput_rps']:.2f}  "
+                  f"p95 x{s['p95_ms'] / o['p95_ms']:.2f}  p99 x{s['p99_ms'] / o['p99_ms']:.2f}")
+
+
+def main(argv: Optional[List[str]] = None):
+    """부하 테스트 실행을 위한 메인 함수입니다."""
+    parser = argparse.ArgumentParser(description="가짜 Gemini/DB로 Flask 사주 앱의 처리량과 지연 시간을 측정합니다.")
+    parser.add_argument("--url", default=None, help="이미 실행 중인 앱 주소 (지정하면 앱과 가짜 서버를 띄우지 않음)")
+    parser.add_argument("--serve", default="gunicorn", help=f"서빙 모드 목록, 쉼표 구분 ({', '.join(SERVE_MODES)})")
+    parser.add_argument("--workers", type=int, default=None, help="gunicorn 워커 수 (기본값: gunicorn.conf.py)")
+    parser.add_argument("--threads", type=int, default=None, help="gunicorn 워커당 스레드 수")
+    parser.add_argument("--app-env", action="append", default=[], metavar="KEY=VALUE",
+                        help="앱 환경 변수 (여러 번 지정 가능, 예: LOG_WRITE_BEHIND=1)")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시 사용자(스레드) 수 (기본값: 20)")
+    parser.add_argument("--duration", type=float, default=30.0, help="측정 시간, 초 (기본값: 30)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"요청 비율 (기본값: {DEFAULT_MIX})")
+    parser.add_argument("--unique-ratio", type=float, default=1.0,
+                        help="캐시에 없는 새 입력으로 보내는 POST 비율 0~1 (기본값: 1.0)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="요청 타임아웃, 초 (기본값: 120)")
+    parser.add_argument("--gemini-latency", type=float, default=2.0, help="가짜 Gemini 평균 지연, 초 (기본값: 2.0)")
+    parser.add_argument("--gemini-jitter", type=float, default=0.5, help="가짜 Gemini 지연 표준편차, 초 (기본값: 0.5)")
+    parser.add_argument("--gemini-error-rate", type=float, default=0.0, help="가짜 Gemini 오류율 0~1 (기본값: 0)")
+    parser.add_argument("--gemini-error-status", type=int, default=429, help="가짜 Gemini 오류 상태 코드 (기본값: 429)")
+    parser.add_argument("--gemini-retry-after", type=int, default=None, help="오류 응답의 Retry-After(초)")
+    parser.add_argument("--db-connect-latency", type=float, default=0.02, help="stand-in DB 연결 지연, 초 (기본값: 0.02)")
+    parser.add_argument("--db-query-latency", type=float, default=0.002, help="stand-in DB 쿼리 지연, 초 (기본값: 0.002)")
+    parser.add_argument("--seed", type=int, default=42, help="요청/오류 난수 seed (기본값: 42)")
+    parser.add_argument("--output", default="loadtest-results.json", help="결과 JSON 파일 (기본값: loadtest-results.json)")
+    parser.add_argument("--compare", metavar="PATH", default=None, help="이전 결과 JSON과 비교하여 출력합니다")
+    args = parser.parse_args(argv)
+
+    try:
+        mix = parse_mix(args.mix)
+        app_env = dict(item.split("=", 1) for item in args.app_env)
+    except ValueError as e:
+        parser.error(str(e))
+    modes = [mode.strip() for mode in args.serve.split(",") if mode.strip()]
+    unknown = [mode for mode in modes if mode not in SERVE_MODES]
+    if unknown:
+        parser.error(f"알 수 없는 서빙 모드: {', '.join(unknown)} (사용 가능: {', '.join(SERVE_MODES)})")
+
+    runs = []
+    if args.url:
+        wait_ready(args.url)
+        result = run_load(args.url, args.concurrency, args.duration, mix, args.unique_ratio, args.seed, args.timeout)
+        result["label"] = "external"
+        print_summary(f"{args.url} 동시성 {args.concurrency}", result)
+        runs.append(result)
+    else:
+        options = {key: getattr(args, key) for key in ("db_connect_latency", "db_query_latency", "gemini_latency",
+                                                        "gemini_jitter", "gemini_error_rate", "gemini_error_status",
+                                                        "gemini_retry_after", "seed")}
+        mysql_port, gemini_port = _free_port(), _free_port()
+        fakes = multiprocessing.get_context("spawn").Process(target=_serve_fakes, args=(mysql_port, gemini_port, options),
+                                                             daemon=True)
+        fakes.start()
+        try:
+            for mode in modes:
+                port = _free_port()
+                app_process = start_app(mode, port, mysql_port, gemini_port, args.workers, args.threads, app_env)
+                base_url = f"http://127.0.0.1:{port}"
+                try:
+                    print(f"🚀 {mode} 모드로 앱 실행: {base_url}")
+                    wait_ready(base_url)
+                    result = run_load(base_url, args.concurrency, args.duration, mix, args.unique_ratio,
+                                      args.seed, args.timeout)
+                finally:
+                    app_process.terminate()
+                    try:
+                        app_process.wait(timeout=30)
+                    except subprocess.TimeoutExpired:
+                        app_process.kill()
+                result["label"] = mode
+                print_summary(f"{mode} 동시성 {args.concurrency}", result)
+                runs.append(result)
+        finally:
+            fakes.terminate()
+            shutil.rmtree(METRICS_DIR, ignore_errors=True)
+
+    document = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "settings": {key: value for key, value in vars(args).items() if key not in ("output", "compare")},
+        "runs": runs
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(document, f, ensure_ascii=False, indent=2)
+    print(f"\n✅ 부하 테스트 결과 저장: {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare_results(json.load(f), document)
+
+if __name__ == "__main__":
+    main()
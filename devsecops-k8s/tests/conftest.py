@@ -0,0 +1,20 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "loadtest"))
+
+
+@pytest.fixture(scope="session")
+def app_module():
+    """가짜 MySQL에 붙인 Flask 앱 모듈 (loadtest/bench_db_pool.py와 같은 방식으로 import)"""
+    from fake_mysql import FakeMySQLServer
+    import bench_db_pool
+
+    server = FakeMySQLServer().start()
+    module = bench_db_pool._load_app(server.port)
+    yield module
+    server.stop()
@@ -0,0 +1,41 @@
+import os
+import runpy
+import subprocess
+import sys
+
+import pytest
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ansible", "roles", "flask", "files")
+
+
+@pytest.mark.parametrize("workers, rate, burst", [(1, 2.0, 10), (4, 0.5, 2), (20, 0.1, 1)])
+def test_token_bucket_splits_quota_across_workers(app_module, workers, rate, burst):
+    bucket = app_module.TokenBucket(rate=120 / 60, burst=10, workers=workers)
+    assert bucket.rate == pytest.approx(rate)
+    assert bucket.burst == burst
+
+
+@pytest.mark.parametrize("env, workers", [({"GUNICORN_WORKERS": "3"}, 3), ({"WEB_CONCURRENCY": "5"}, 5),
+                                          ({"GUNICORN_WORKERS": "2", "WEB_CONCURRENCY": "9"}, 2)])
+def test_gunicorn_conf_exports_worker_count(monkeypatch, tmp_path, env, workers):
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    monkeypatch.delenv("GUNICORN_WORKERS", raising=False)
+    monkeypatch.setenv("WEB_CONCURRENCY", "")
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+    conf = runpy.run_path(os.path.join(APP_DIR, "gunicorn.conf.py"))
+
+    assert conf["workers"] == workers
+    assert os.environ["WEB_CONCURRENCY"] == str(workers)
+
+
+def test_app_limiter_uses_worker_share(tmp_path):
+    # 모듈 기본값은 import 시점에 정해지므로 새 프로세스에서 확인
+    env = dict(os.environ, WEB_CONCURRENCY="4", GEMINI_RATE_LIMIT="120", GEMINI_RATE_BURST="10",
+               LOG_SPILL_PATH=str(tmp_path / "spill.jsonl"))
+    env.pop("PROMETHEUS_MULTIPROC_DIR", None)
+    out = subprocess.run([sys.executable, "-c", "import app; print(app.gemini_limiter.rate, app.gemini_limiter.burst)"],
+                         cwd=APP_DIR, env=env, capture_output=True, text=True, check=True).stdout.split()
+    assert float(out[0]) == pytest.approx(0.5)
+    assert int(out[1]) == 2
@@ -0,0 +1,42 @@
+import json
+
+
+def _writer(app_module, monkeypatch, tmp_path, fail):
+    """insert_logs를 기록용으로 바꾼 LogWriter. fail()이 참이면 저장 실패"""
+    inserted = []
+
+    def insert_logs(rows):
+        if fail(rows):
+            raise app_module.pymysql.err.OperationalError(2003, "down")
+        inserted.extend(rows)
+
+    monkeypatch.setattr(app_module, "insert_logs", insert_logs)
+    monkeypatch.setattr(app_module.time, "sleep", lambda s: None)
+    spill = tmp_path / "logs_spill.jsonl"
+    return app_module.LogWriter(batch_size=2, spill_path=str(spill)), spill, inserted
+
+
+def test_truncated_spill_line_is_quarantined(app_module, monkeypatch, tmp_path):
+    writer, spill, inserted = _writer(app_module, monkeypatch, tmp_path, lambda rows: False)
+    good = [["a", "양력 1990-01-01", "1", "결과"], ["b", "양력 1991-02-02", "2", "결과"]]
+    spill.write_text(json.dumps(good[0], ensure_ascii=False) + "\n"
+                     + '["broken", "양력 19\n'
+                     + json.dumps(good[1], ensure_ascii=False) + "\n", encoding="utf-8")
+
+    writer._write([("c", "양력 1992-03-03", "3", "결과")])
+
+    assert [row[0] for row in inserted] == ["c", "a", "b"]
+    assert writer.written == 1 and writer.replayed == 2 and writer.spilled == 0
+    assert spill.read_text(encoding="utf-8") == ""
+    assert (tmp_path / "logs_spill.jsonl.bad").read_text(encoding="utf-8") == '["broken", "양력 19\n'
+
+
+def test_replay_error_does_not_reinsert_or_spill_batch(app_module, monkeypatch, tmp_path):
+    writer, spill, inserted = _writer(app_module, monkeypatch, tmp_path, lambda rows: False)
+    # spill 파일을 열 수 없는 경우 (OSError)
+    spill.mkdir()
+
+    writer._write([("c", "x", "3", "r")])
+
+    assert [row[0] for row in inserted] == ["c"]
+    assert writer.written == 1 and writer.batches == 1 and writer.spilled == 0
@@ -0,0 +1,71 @@
+import functools
+import io
+import json
+
+import pytest
+
+import generate_security_report as gsr
+
+SARIF = {
+    "version": "2.1.0",
+    "runs": [{
+        "tool": {"driver": {"name": "Trivy", "rules": [
+            {"id": "CVE-2024-0001", "properties": {"security-severity": "9.8", "precision": 1.25}},
+        ]}},
+        "results": [
+            {"ruleId": "CVE-2024-0001", "level": "error", "rank": 1.25, "score": 1e10,
+             "delta": -2.5, "tiny": 3.5E-7, "count": 12, "ok": True, "note": None,
+             "message": {"text": "openssl 3.0.2 \"취약\""},
+             "locations": [{"physicalLocation": {"artifactLocation": {"uri": "Dockerfile"},
+                                                 "region": {"startLine": 7, "startColumn": 1}}}]},
+            {"ruleId": "CVE-2024-0002", "level": "warning", "rank": -0.0, "score": 2.5e+3,
+             "message": {"text": "x"},
+             "locations": [{"physicalLocation": {"artifactLocation": {"uri": "main.tf"}}}]},
+        ],
+    }],
+}
+CHUNK_SIZES = [1, 2, 3, 4, 5, 7, 16, 64 * 1024]
+
+
+def _walk(reader):
+    """iter_object_keys/iter_array/read_value로 값을 다시 조립합니다 (스트리밍 경로와 같은 호출 순서)"""
+    char = reader.peek()
+    if char == "{":
+        result = {}
+        for key in reader.iter_object_keys():
+            result[key] = _walk(reader)
+        return result
+    if char == "[":
+        return [_walk(reader) for _ in reader.iter_array()]
+    return reader.read_value()
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("indent", [None, 2])
+def test_stream_reader_matches_json_load(chunk_size, indent):
+    text = json.dumps(SARIF, ensure_ascii=False, indent=indent)
+    reader = gsr._JsonStreamReader(io.StringIO(text), chunk_size=chunk_size)
+    assert _walk(reader) == json.loads(text)
+    assert reader.peek() == ""
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("text", ['{"z": 1.25}', '{"n": 1e10}', '{"d": -2.5, "e": 1E-3}', '[1.5,2e2,-3]'])
+def test_stream_reader_numbers_at_chunk_boundary(chunk_size, text):
+    reader = gsr._JsonStreamReader(io.StringIO(text), chunk_size=chunk_size)
+    assert _walk(reader) == json.loads(text)
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_iter_sarif_results_small_chunks(chunk_size, tmp_path, monkeypatch):
+    path = tmp_path / "trivy-results.sarif"
+    path.write_text(json.dumps(SARIF, ensure_ascii=False), encoding="utf-8")
+    monkeypatch.setattr(gsr, "_JsonStreamReader",
+                        functools.partial(gsr._JsonStreamReader, chunk_size=chunk_size))
+
+    assert list(gsr.iter_sarif_results(str(path))) == SARIF["runs"][0]["results"]
+    streamed = gsr.parse_sarif_file(str(path), streaming=True)
+    assert "error" not in streamed
+    loaded = gsr.parse_sarif_file(str(path))
+    assert streamed["total_vulnerabilities"] == loaded["total_vulnerabilities"] == 2
+    assert streamed["severity_distribution"] == loaded["severity_distribution"]